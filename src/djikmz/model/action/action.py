@@ -4,7 +4,7 @@ from enum import Enum
 from pydantic import BaseModel, Field, field_validator, model_serializer
 import xmltodict
 
-from .registry import ACTION_REGISTRY
+from .registry import ACTION_REGISTRY, ACTION_TYPE_BY_CLASS
 
 
 class ActionType(str, Enum):
@@ -49,13 +49,11 @@ class Action(BaseModel):
     
     def model_post_init(self, __context) -> None:
         if self.action_type is None:
-            for action_type, registered_class in ACTION_REGISTRY.items():
-                if registered_class == self.__class__:
-                    # Use object.__setattr__ to bypass frozen restriction
-                    object.__setattr__(self, 'action_type', action_type)
-                    break
-            else:
+            action_type = ACTION_TYPE_BY_CLASS.get(self.__class__)
+            if action_type is None:
                 raise ValueError(f"Action class {self.__class__.__name__} not found in ACTION_REGISTRY")
+            # Use object.__setattr__ to bypass frozen restriction
+            object.__setattr__(self, 'action_type', action_type)
 
     def to_dict(self) -> Dict[str, Any]:
         data = {field.serialization_alias or name: getattr(self,name) for name , field in type(self).model_fields.items() if getattr(self, name) is not None}
@@ -1,7 +1,10 @@
 ACTION_REGISTRY = {}
+# Reverse of ACTION_REGISTRY: action class -> action type
+ACTION_TYPE_BY_CLASS = {}
 
 def register_action(action_cls):
     def warpper(cls):
         ACTION_REGISTRY[action_cls] = cls
+        ACTION_TYPE_BY_CLASS[cls] = action_cls
         return cls
     return warpper
\ No newline at end of file
@@ -1,7 +1,7 @@
 import xmltodict
 from .action import Action
-from pydantic import BaseModel, Field, field_validator, model_validator
-from typing import Dict, Any, List, Optional, Union
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
+from typing import Dict, Any, Iterable, List, Optional, Union
 from enum import Enum
 
 class TriggerType(str, Enum):
@@ -101,6 +101,15 @@ class ActionGroup(BaseModel):
         serialization_alias="actionTrigger",
         description="Trigger for the action group"
     )
+    # True while the action IDs are exactly 1..len(actions) in order, so an ID is its position + 1.
+    # actions can be changed directly, so _check_contiguous() re-checks the end IDs before use
+    _contiguous: bool = PrivateAttr(default=True)
+    # action_id -> position in actions, only kept current while the IDs are not contiguous
+    _id_index: Dict[int, int] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context) -> None:
+        self._reindex()
+
     @model_validator(mode="after")
     def validate_start_end(self) -> "ActionGroup":
         """Ensure start and end waypoint IDs are set correctly."""
@@ -133,7 +142,8 @@ class ActionGroup(BaseModel):
     @classmethod
     def from_xml(cls, xml_data: str):
         """Create ActionGroup from XML data."""
-        data = xmltodict.parse(xml_data)["wpml:actionGroup"]
+        # force_list keeps a single <wpml:action> as a one-element list instead of a dict
+        data = xmltodict.parse(xml_data, force_list=("wpml:action",))["wpml:actionGroup"]
         group_id = int(data.get("wpml:actionGroupId", 0))
         start_waypoint_id = int(data.get("wpml:actionGroupStartIndex", 0))
         end_waypoint_id = int(data.get("wpml:actionGroupEndIndex", 0))
@@ -181,14 +191,61 @@ class ActionGroup(BaseModel):
         
         return cls(**clean_data)
     
+    def _reindex(self) -> None:
+        """Rebuild the action ID index. The first action wins on duplicate IDs."""
+        index = {}
+        contiguous = True
+        for i, action in enumerate(self.actions):
+            index.setdefault(action.action_id, i)
+            contiguous = contiguous and action.action_id == i + 1
+        self._id_index = index
+        self._contiguous = contiguous
+
+    def _check_contiguous(self) -> None:
+        """Reindex if actions was changed directly so that its end IDs no longer fit _contiguous."""
+        actions = self.actions
+        if self._contiguous and actions and (actions[0].action_id != 1 or actions[-1].action_id != len(actions)):
+            self._reindex()
+
+    def _index_of(self, action_id: int) -> Optional[int]:
+        """Return the position of the action with the given ID, or None."""
+        self._check_contiguous()
+        actions = self.actions
+        if self._contiguous:
+            if not 1 <= action_id <= len(actions):
+                return None
+            idx = action_id - 1
+        else:
+            idx = self._id_index.get(action_id)
+            # Not indexed: only rebuild if a plain scan finds it (e.g. after a direct append)
+            if idx is None and all(action.action_id != action_id for action in actions):
+                return None
+        if idx is None or idx >= len(actions) or actions[idx].action_id != action_id:
+            # Stale, actions was changed directly (item or list assignment), so rebuild and retry
+            self._reindex()
+            idx = self._id_index.get(action_id)
+        return idx
+
     def _renumber_actions(self):
         """Renumber all actions to have sequential IDs starting from 1."""
-        for i, action in enumerate(self.actions, 1):
-            # Create a new action with updated ID to maintain immutability
-            action_dict = action.model_dump()
-            action_dict['action_id'] = i
-            # Replace the action with a new instance with updated ID
-            self.actions[i-1] = type(action)(**action_dict)
+        self._renumber_from(0)
+
+    def _renumber_from(self, start: int) -> None:
+        """
+        Renumber the actions from position start onwards.
+        
+        The actions before start must already be numbered 1..start, so only
+        pass a non-zero start while the group is contiguous.
+        """
+        actions = self.actions
+        for action_id in range(start + 1, len(actions) + 1):
+            action = actions[action_id - 1]
+            if action.action_id != action_id:
+                # Replace the action with a copy carrying the new ID to maintain immutability
+                actions[action_id - 1] = action.model_copy(update={'action_id': action_id})
+        # Lookups go by position from here on, so the ID index is not needed
+        self._contiguous = True
+        self._id_index = {}
     
     def add_action(self, action: Action, auto_id: bool = True) -> None:
         """
@@ -199,12 +256,35 @@ class ActionGroup(BaseModel):
             auto_id: If True, automatically assign the next sequential ID
         """
         if auto_id:
-            new_id = len(self.actions) + 1
-            action_dict = action.model_dump()
-            action_dict['action_id'] = new_id
-            action = type(action)(**action_dict)
+            action = action.model_copy(update={'action_id': self.next_action_id})
         
+        self._check_contiguous()
         self.actions.append(action)
+        if not self._contiguous:
+            self._id_index.setdefault(action.action_id, len(self.actions) - 1)
+        elif action.action_id != len(self.actions):
+            self._reindex()
+    
+    def add_actions(self, actions: Iterable[Action], auto_id: bool = True) -> None:
+        """
+        Add several actions to the end of the group in one step.
+        
+        Args:
+            actions: The actions to add, in order
+            auto_id: If True, assign sequential IDs following the existing actions
+        """
+        start = len(self.actions)
+        if auto_id:
+            actions = [action.model_copy(update={'action_id': i})
+                       for i, action in enumerate(actions, start + 1)]
+        self._check_contiguous()
+        self.actions.extend(actions)
+        
+        if not self._contiguous:
+            for i in range(start, len(self.actions)):
+                self._id_index.setdefault(self.actions[i].action_id, i)
+        elif any(self.actions[i].action_id != i + 1 for i in range(start, len(self.actions))):
+            self._reindex()
     
     def insert_action(self, index: int, action: Action, auto_renumber: bool = True) -> None:
         """
@@ -215,13 +295,17 @@ class ActionGroup(BaseModel):
             action: The action to insert
             auto_renumber: If True, renumber all actions after insertion
         """
-        if index < 0 or index > len(self.actions):
-            raise ValueError(f"Index {index} out of range for {len(self.actions)} actions")
+        n = len(self.actions)
+        if index < 0 or index > n:
+            raise ValueError(f"Index {index} out of range for {n} actions")
         
+        self._check_contiguous()
         self.actions.insert(index, action)
         
         if auto_renumber:
-            self._renumber_actions()
+            self._renumber_from(index if self._contiguous else 0)
+        else:
+            self._reindex()
     
     def remove_action(self, action_id: int, auto_renumber: bool = True) -> bool:
         """
@@ -234,13 +318,15 @@ class ActionGroup(BaseModel):
         Returns:
             True if action was found and removed, False otherwise
         """
-        for i, action in enumerate(self.actions):
-            if action.action_id == action_id:
-                self.actions.pop(i)
-                if auto_renumber:
-                    self._renumber_actions()
-                return True
-        return False
+        idx = self._index_of(action_id)
+        if idx is None:
+            return False
+        self.actions.pop(idx)
+        if auto_renumber:
+            self._renumber_from(idx if self._contiguous else 0)
+        else:
+            self._reindex()
+        return True
     
     def remove_action_at(self, index: int, auto_renumber: bool = True) -> Action:
         """
@@ -256,13 +342,17 @@ class ActionGroup(BaseModel):
         Raises:
             IndexError: If index is out of range
         """
-        if index < 0 or index >= len(self.actions):
-            raise IndexError(f"Index {index} out of range for {len(self.actions)} actions")
+        n = len(self.actions)
+        if index < 0 or index >= n:
+            raise IndexError(f"Index {index} out of range for {n} actions")
         
+        self._check_contiguous()
         removed_action = self.actions.pop(index)
         
         if auto_renumber:
-            self._renumber_actions()
+            self._renumber_from(index if self._contiguous else 0)
+        else:
+            self._reindex()
             
         return removed_action
     
@@ -275,20 +365,28 @@ class ActionGroup(BaseModel):
             to_index: New position for the action (0-based)
             auto_renumber: If True, renumber all actions after move
         """
-        if from_index < 0 or from_index >= len(self.actions):
+        n = len(self.actions)
+        if from_index < 0 or from_index >= n:
             raise IndexError(f"From index {from_index} out of range")
-        if to_index < 0 or to_index >= len(self.actions):
+        if to_index < 0 or to_index >= n:
             raise IndexError(f"To index {to_index} out of range")
+        if from_index == to_index:
+            return  # Nothing moves
         
+        self._check_contiguous()
         action = self.actions.pop(from_index)
         self.actions.insert(to_index, action)
         
         if auto_renumber:
-            self._renumber_actions()
+            self._renumber_from(min(from_index, to_index) if self._contiguous else 0)
+        else:
+            self._reindex()
     
     def clear_actions(self) -> None:
         """Remove all actions from the group."""
         self.actions.clear()
+        self._contiguous = True
+        self._id_index = {}
     
     def get_action_by_id(self, action_id: int) -> Optional[Action]:
         """
@@ -300,10 +398,8 @@ class ActionGroup(BaseModel):
         Returns:
             The action if found, None otherwise
         """
-        for action in self.actions:
-            if action.action_id == action_id:
-                return action
-        return None
+        idx = self._index_of(action_id)
+        return self.actions[idx] if idx is not None else None
     
     
     @property
@@ -6,8 +6,10 @@ including different heading modes and their specific parameters.
 """
 
 from typing import Optional, List, Dict, Any, Union
-from pydantic import BaseModel, Field, field_validator, model_validator, model_serializer
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator, model_validator, model_serializer
 from enum import Enum
+from functools import lru_cache
+import math
 
 
 class WaypointHeadingMode(str, Enum):
@@ -48,9 +50,24 @@ class WaypointHeadingPathMode(str, Enum):
         return self.value
 
 
+# value -> member tables for the string validators below
+_HEADING_MODE_BY_VALUE = {m.value: m for m in WaypointHeadingMode}
+_PATH_MODE_BY_VALUE = {m.value: m for m in WaypointHeadingPathMode}
+
+# XML element name (without the wpml: prefix) -> WaypointHeadingParam field
+_FIELD_BY_KEY = {
+    "waypointHeadingMode": "waypoint_heading_mode",
+    "waypointHeadingAngle": "waypoint_heading_angle",
+    "waypointPoiPoint": "waypoint_poi_point",
+    "waypointHeadingPathMode": "waypoint_heading_path_mode",
+}
+
+
 class WaypointPoiPoint(BaseModel):
     """Point of interest coordinates for towardPOI heading mode."""
     
+    model_config = ConfigDict(frozen=True)
+    
     latitude: float = Field(
         description="POI latitude in decimal degrees",
         ge=-90,
@@ -68,6 +85,23 @@ class WaypointPoiPoint(BaseModel):
         description="POI altitude in meters (currently not used for Z-direction orientation)"
     )
     
+    @classmethod
+    def get(cls, latitude: float, longitude: float, altitude: float = 0.0) -> "WaypointPoiPoint":
+        """
+        Return a POI point for the given coordinates.
+        
+        Points are frozen and cached, so equal coordinates give the same
+        shared instance rather than a new one.
+        """
+        # lru_cache treats -0.0 and 0.0 as one key, so pass the signs too to keep "-0.0" as read
+        signs = tuple(math.copysign(1.0, value) for value in (latitude, longitude, altitude))
+        return cls._get(latitude, longitude, altitude, signs)
+    
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _get(cls, latitude: float, longitude: float, altitude: float, signs: tuple) -> "WaypointPoiPoint":
+        return cls(latitude=latitude, longitude=longitude, altitude=altitude)
+    
     def to_string(self) -> str:
         """Convert to comma-separated string format for XML."""
         return f"{self.latitude},{self.longitude},{self.altitude}"
@@ -75,15 +109,13 @@ class WaypointPoiPoint(BaseModel):
     @classmethod
     def from_string(cls, poi_string: str) -> "WaypointPoiPoint":
         """Create from comma-separated string format."""
-        parts = poi_string.split(',')
+        # At most 4 parts are produced, enough to reject extra values
+        parts = poi_string.split(',', 3)
         if len(parts) != 3:
             raise ValueError("POI point string must be in format 'lat,lon,alt'")
         
-        return cls(
-            latitude=float(parts[0]),
-            longitude=float(parts[1]), 
-            altitude=float(parts[2])
-        )
+        latitude, longitude, altitude = parts
+        return cls.get(float(latitude), float(longitude), float(altitude))
 
 
 class WaypointHeadingParam(BaseModel):
@@ -94,6 +126,8 @@ class WaypointHeadingParam(BaseModel):
     supporting various heading modes with their specific requirements.
     """
     
+    model_config = ConfigDict(frozen=True)
+    
     waypoint_heading_mode: WaypointHeadingMode|str = Field(
         default=WaypointHeadingMode.FOLLOW_WAYLINE,
         serialization_alias="waypointHeadingMode",
@@ -125,23 +159,23 @@ class WaypointHeadingParam(BaseModel):
     def validate_heading_mode(cls, v: Union[WaypointHeadingMode, str]) -> WaypointHeadingMode:
         """Validate and convert heading mode."""
 
-        if isinstance(v, str):
-            try:
-                return WaypointHeadingMode(v)
-            except ValueError:
-                raise ValueError(f"Invalid waypoint heading mode: {v}")
-        return v
+        if isinstance(v, WaypointHeadingMode):
+            return v
+        mode = _HEADING_MODE_BY_VALUE.get(v)
+        if mode is None:
+            raise ValueError(f"Invalid waypoint heading mode: {v}")
+        return mode
     
     @field_validator('waypoint_heading_path_mode')
     @classmethod
     def validate_path_mode(cls, v: Union[WaypointHeadingPathMode, str]) -> WaypointHeadingPathMode:
         """Validate and convert path mode."""
-        if isinstance(v, str):
-            try:
-                return WaypointHeadingPathMode(v)
-            except ValueError:
-                raise ValueError(f"Invalid waypoint heading path mode: {v}")
-        return v
+        if isinstance(v, WaypointHeadingPathMode):
+            return v
+        mode = _PATH_MODE_BY_VALUE.get(v)
+        if mode is None:
+            raise ValueError(f"Invalid waypoint heading path mode: {v}")
+        return mode
      
     @model_validator(mode='after')
     def validate_mode_requirements(self) -> 'WaypointHeadingParam':
@@ -166,15 +200,15 @@ class WaypointHeadingParam(BaseModel):
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary with XML-compatible format."""
         result = {
-            f"wpml:{WaypointHeadingParam.model_fields['waypoint_heading_mode'].serialization_alias}": self.waypoint_heading_mode.value,
-            f"wpml:{WaypointHeadingParam.model_fields['waypoint_heading_path_mode'].serialization_alias}": self.waypoint_heading_path_mode.value
+            "wpml:waypointHeadingMode": self.waypoint_heading_mode.value,
+            "wpml:waypointHeadingPathMode": self.waypoint_heading_path_mode.value
         }
         
         if self.waypoint_heading_angle is not None:
-            result[f"wpml:{WaypointHeadingParam.model_fields['waypoint_heading_angle'].serialization_alias}"] = self.waypoint_heading_angle
+            result["wpml:waypointHeadingAngle"] = self.waypoint_heading_angle
         
         if self.waypoint_poi_point is not None:
-            result[f"wpml:{WaypointHeadingParam.model_fields['waypoint_poi_point'].serialization_alias}"] = self.waypoint_poi_point.to_string()
+            result["wpml:waypointPoiPoint"] = self.waypoint_poi_point.to_string()
         
         return result
     
@@ -185,24 +219,25 @@ class WaypointHeadingParam(BaseModel):
         clean_data = {}
         
         for key, value in data.items():
-            clean_key = key.replace("wpml:", "")
+            field_name = _FIELD_BY_KEY.get(key.removeprefix("wpml:"))
+            if field_name is None:
+                continue
             
-            if clean_key == "waypointHeadingMode":
-                clean_data["waypoint_heading_mode"] = value
-            elif clean_key == "waypointHeadingAngle":
-                clean_data["waypoint_heading_angle"] = float(value)
-            elif clean_key == "waypointPoiPoint":
-                clean_data["waypoint_poi_point"] = WaypointPoiPoint.from_string(str(value))
-            elif clean_key == "waypointHeadingPathMode":
-                clean_data["waypoint_heading_path_mode"] = value
+            if field_name == "waypoint_heading_angle":
+                value = float(value)
+            elif field_name == "waypoint_poi_point":
+                value = WaypointPoiPoint.from_string(str(value))
+            clean_data[field_name] = value
         
-        return cls(**clean_data)
+        if cls is WaypointHeadingParam:
+            return _HEADING_ADAPTER.validate_python(clean_data)
+        return cls.model_validate(clean_data)
     
     def to_xml(self) -> str:
         """Convert to XML string."""
-        import xmltodict
-        xml_dict = self.to_dict()
-        return xmltodict.unparse(xml_dict, pretty=True, full_document=False)
+        # Flat elements whose values are enum values, floats or the POI
+        # string, so they are written directly without escaping
+        return "".join([f"<{key}>{value}</{key}>" for key, value in self.to_dict().items()])
     
     @classmethod
     def from_xml(cls, xml_data: str) -> "WaypointHeadingParam":
@@ -244,3 +279,6 @@ class WaypointHeadingParam(BaseModel):
         """Serialize the heading parameter to a dictionary."""
         return self.to_dict()
 
+
+# Built once; validate_python on it is cheaper per call than cls(**data)
+_HEADING_ADAPTER = TypeAdapter(WaypointHeadingParam)
@@ -6,6 +6,7 @@ from .heading_param import WaypointHeadingParam
 from .turn_param import WaypointTurnMode
 from .waypoint import Waypoint
 from enum import Enum
+from functools import lru_cache
 import xmltodict
 
 ATTR_NOT_IN_FOLDER = [
@@ -27,6 +28,25 @@ class GimbalPitchMode(StrEnum):
     POINT_SETTING = "usePointSetting"
 
 
+@lru_cache(maxsize=None)
+def _alias_to_field(model_cls: type[BaseModel]) -> dict:
+    """Serialization alias (or field name) -> field name, built once per model class."""
+    return {
+        field_info.serialization_alias or field_name: field_name
+        for field_name, field_info in model_cls.model_fields.items()
+    }
+
+
+@lru_cache(maxsize=None)
+def _field_from_dict(model_cls: type[BaseModel]) -> dict:
+    """Field name -> from_dict of its annotation, for fields whose type provides one."""
+    return {
+        field_name: field_info.annotation.from_dict
+        for field_name, field_info in model_cls.model_fields.items()
+        if hasattr(field_info.annotation, 'from_dict')
+    }
+
+
 class KML(BaseModel):
     author: str = Field(
         default="Zey",
@@ -124,10 +144,7 @@ class KML(BaseModel):
     @classmethod
     def from_dict(cls, data: dict) -> 'KML':
         """Create a KML instance from a dictionary."""
-        alias_to_field = {}
-        for field_name, field_info in cls.model_fields.items():
-            alias = field_info.serialization_alias or field_name
-            alias_to_field[alias] = field_name
+        alias_to_field = _alias_to_field(cls)
         folder_data = data.pop("Folder", {})
         data = {**data, **folder_data}
         # Remove wpml: prefix from keys
@@ -139,12 +156,15 @@ class KML(BaseModel):
         # Generate alias to field mapping automatically
         clean_data = {alias_to_field.get(k, k): v for k, v in clean_data.items()}
         # if a field class have from_dict method, call it 
+        field_from_dict = _field_from_dict(cls)
+        model_fields = cls.model_fields
         for field_name, field_value in clean_data.items():
-            field_class = cls.model_fields[field_name].annotation
-            if hasattr(field_class, 'from_dict'):
-                clean_data[field_name] = field_class.from_dict(field_value) if isinstance(field_value, dict) else field_value
+            if field_name not in model_fields:
+                raise KeyError(field_name)
+            from_dict = field_from_dict.get(field_name)
+            if from_dict is not None and isinstance(field_value, dict):
+                clean_data[field_name] = from_dict(field_value)
         
-        print(clean_data)
         return cls(**clean_data, waypoints=waypoints)
     
     def to_xml(self) -> str:
@@ -1,6 +1,7 @@
-from pydantic import BaseModel, Field, computed_field, model_serializer
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, computed_field, model_serializer
 from typing import Optional, Dict, Any, Union
 from enum import Enum
+from functools import lru_cache
 import xmltodict
 
 class FlyToWaylineMode(str, Enum):
@@ -47,17 +48,20 @@ class DroneModel(str, Enum):
         return self.value
 
 MODEL_TO_VAL = {
-    DroneModel.M350: [89, None],
-    DroneModel.M300: [60, None],
-    DroneModel.M30: [67, 0],
-    DroneModel.M30T: [67, 1],
-    DroneModel.M3E: [77, 0],
-    DroneModel.M3T: [77, 1],
-    DroneModel.M3M: [77, 2],
-    DroneModel.M3D: [91, 0],
-    DroneModel.M3TD: [91, 1],
+    DroneModel.M350: (89, None),
+    DroneModel.M300: (60, None),
+    DroneModel.M30: (67, 0),
+    DroneModel.M30T: (67, 1),
+    DroneModel.M3E: (77, 0),
+    DroneModel.M3T: (77, 1),
+    DroneModel.M3M: (77, 2),
+    DroneModel.M3D: (91, 0),
+    DroneModel.M3TD: (91, 1),
 }
 
+# (droneEnumValue, droneSubEnumValue) -> DroneModel; models without a sub enum value are keyed with None
+VAL_TO_MODEL = {vals: model for model, vals in MODEL_TO_VAL.items()}
+
 class PayloadModel(int, Enum):
     H20 = 42
     H20T = 43
@@ -78,6 +82,8 @@ class PayloadModel(int, Enum):
         return str(self.value)
 
 class DroneInfo(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     drone_model: DroneModel = Field(
         default=DroneModel.M350)
     @computed_field(alias='droneEnumValue')
@@ -119,10 +125,14 @@ class DroneInfo(BaseModel):
         if drone_sub_enum_value is not None:
             drone_sub_enum_value = int(drone_sub_enum_value)
         
-        # iterate through MODEL_TO_VAL to find the matching drone model
-        for model, (enum_value, sub_enum_value) in MODEL_TO_VAL.items():
-            if enum_value == drone_enum_value and (sub_enum_value is None or sub_enum_value == drone_sub_enum_value):
-                return cls(drone_model=model)
+        # exact match first, then a model that has no sub enum value
+        model = VAL_TO_MODEL.get((drone_enum_value, drone_sub_enum_value))
+        if model is None:
+            model = VAL_TO_MODEL.get((drone_enum_value, None))
+        if model is not None:
+            if cls is DroneInfo:
+                return _build_drone_info(model)
+            return cls(drone_model=model)
         raise ValueError(f"Unknown drone model with enum value {drone_enum_value} and sub enum value {drone_sub_enum_value}")
     
     def to_xml(self) -> str:
@@ -136,6 +146,12 @@ class DroneInfo(BaseModel):
         """
         Create a DroneInfo instance from XML data.
         """
+        if cls is DroneInfo:
+            return _drone_info_from_xml(xml_data)
+        return cls._parse_xml(xml_data)
+    
+    @classmethod
+    def _parse_xml(cls, xml_data: str) -> 'DroneInfo':
         data = xmltodict.parse(xml_data)
         drone_data = data.get('wpml:droneInfo', data)
         if drone_data is None:
@@ -146,6 +162,8 @@ class DroneInfo(BaseModel):
     
 
 class PayloadInfo(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     payload_model: PayloadModel = Field(
         default=PayloadModel.M3M,
         serialization_alias="payloadEnumValue",
@@ -182,6 +200,10 @@ class PayloadInfo(BaseModel):
                 else:
                     params[field_name] = value
         
+        position = params.get('position', 0)
+        if cls is PayloadInfo and isinstance(position, (int, str)):
+            return _build_payload_info(params.get('payload_model', PayloadModel.M3M), position)
+        # Anything else (e.g. a nested XML element) goes straight to validation
         return cls(**params)
     
     def to_xml(self) -> str:
@@ -192,6 +214,12 @@ class PayloadInfo(BaseModel):
     @classmethod
     def from_xml(cls, xml_data: str) -> 'PayloadInfo':
         """Create a PayloadInfo instance from XML data."""
+        if cls is PayloadInfo:
+            return _payload_info_from_xml(xml_data)
+        return cls._parse_xml(xml_data)
+    
+    @classmethod
+    def _parse_xml(cls, xml_data: str) -> 'PayloadInfo':
         try:
             data = xmltodict.parse(xml_data)
             payload_data = data.get("wpml:payloadInfo", data)
@@ -204,6 +232,34 @@ class PayloadInfo(BaseModel):
     def serialize(self) -> Dict[str, Any]:
         """Serialize the PayloadInfo to a dictionary."""
         return self.to_dict()
+
+
+# Built once at import and reused by the from_dict paths above
+_DRONE_ADAPTER = TypeAdapter(DroneInfo)
+_PAYLOAD_ADAPTER = TypeAdapter(PayloadInfo)
+
+
+# DroneInfo and PayloadInfo are frozen, so identical ones read back from
+# dicts or XML can be shared instead of validated again
+@lru_cache(maxsize=32)
+def _build_drone_info(drone_model: DroneModel) -> DroneInfo:
+    return _DRONE_ADAPTER.validate_python({"drone_model": drone_model})
+
+
+@lru_cache(maxsize=32, typed=True)
+def _build_payload_info(payload_model: PayloadModel, position: Union[int, str]) -> PayloadInfo:
+    return _PAYLOAD_ADAPTER.validate_python({"payload_model": payload_model, "position": position})
+
+
+# Same for whole XML fragments: repeated strings skip parsing as well
+@lru_cache(maxsize=64)
+def _drone_info_from_xml(xml_data: str) -> DroneInfo:
+    return DroneInfo._parse_xml(xml_data)
+
+
+@lru_cache(maxsize=64)
+def _payload_info_from_xml(xml_data: str) -> PayloadInfo:
+    return PayloadInfo._parse_xml(xml_data)
     
 
 class MissionConfig(BaseModel):
@@ -18,6 +18,8 @@ from .model.action_group import ActionGroup, ActionTrigger, TriggerType
 from .model.action import  RotateYawAction, GimbalRotateAction, HoverAction, TakePhotoAction 
 import zipfile
 import io
+import copy
+import math
 
 # Drone configurations with defaults
 DRONE_CONFIGS = {
@@ -105,6 +107,49 @@ DRONE_CONFIGS = {
 }
 
 
+# Internally built models whose values come from DRONE_CONFIGS, fixed mappings or
+# already-validated objects skip pydantic validation. Set to False to re-enable it.
+_TRUST_INTERNAL = True
+
+
+def _construct(model_cls, **kwargs):
+    """Create a model from known-valid values, bypassing validation when trusted."""
+    if _TRUST_INTERNAL:
+        return model_cls.model_construct(**kwargs)
+    return model_cls(**kwargs)
+
+
+# Pre-validated gimbal actions for the fixed angles the builder emits most often.
+# Builders hand out shallow copies so action_id can be reassigned per instance.
+_GIMBAL_FRONT_TEMPLATE = GimbalRotateAction(
+    action_id=0,
+    gimbal_pitch_rotate_enable=1,
+    gimbal_pitch_rotate_angle=0.0
+)
+_GIMBAL_PITCH_TEMPLATES = {
+    angle: GimbalRotateAction(
+        action_id=0,
+        gimbal_pitch_rotate_enable=1,
+        gimbal_pitch_rotate_angle=angle
+    )
+    for angle in (-90.0, -45.0, 45.0, 90.0)
+}
+_GIMBAL_PITCH_TEMPLATES[0.0] = _GIMBAL_FRONT_TEMPLATE
+
+
+def _gimbal_pitch_action(angle: float) -> GimbalRotateAction:
+    """Return a fresh pitch-only GimbalRotateAction, copied from a template when possible."""
+    # -0.0 (e.g. from gimbal_down(0.0)) equals the 0.0 key, skip the templates so the sign is kept
+    template = _GIMBAL_PITCH_TEMPLATES.get(angle) if angle or math.copysign(1.0, angle) > 0 else None
+    if template is not None:
+        return copy.copy(template)
+    return GimbalRotateAction(
+        action_id=0,  # Will be assigned at build time
+        gimbal_pitch_rotate_enable=1,
+        gimbal_pitch_rotate_angle=angle
+    )
+
+
 class ValidationError(Exception):
     """Raised when mission validation fails."""
     pass
@@ -138,7 +183,8 @@ class WaypointBuilder:
         if turn_mode not in mapping:
             raise ValueError(f"Invalid turn mode: {turn_mode}. Supported: {', '.join(mapping.keys())}")
         self._waypoint.use_global_turn_param = 0
-        self._waypoint.turn_param = WaypointTurnParam(
+        self._waypoint.turn_param = _construct(
+            WaypointTurnParam,
             waypoint_turn_mode=mapping[turn_mode],
             waypoint_turn_damping_dist=0.2 if turn_mode == "early_turn" else None  
         )
@@ -198,11 +244,7 @@ class WaypointBuilder:
         Args:
             angle: Absolute pitch angle in degrees (0 = forward, 90 = straight down)
         """
-        action = GimbalRotateAction(
-            action_id=0,  # Will be assigned at build time
-            gimbal_pitch_rotate_enable=1,
-            gimbal_pitch_rotate_angle=-abs(angle)  # Negative for downward from forward
-        )
+        action = _gimbal_pitch_action(-abs(angle))  # Negative for downward from forward
         self._actions.append(action)
         return self
     
@@ -212,22 +254,13 @@ class WaypointBuilder:
         Args:
             angle: Absolute pitch angle in degrees (0 = forward, positive = upward)
         """
-        action = GimbalRotateAction(
-            action_id=0,  # Will be assigned at build time
-            gimbal_pitch_rotate_enable=1,
-            gimbal_pitch_rotate_angle=abs(angle)  # Positive for upward
-        )
+        action = _gimbal_pitch_action(abs(angle))  # Positive for upward
         self._actions.append(action)
         return self
     
     def gimbal_front(self) -> 'WaypointBuilder':
         """Point gimbal straight forward (0 degrees pitch)."""
-        action = GimbalRotateAction(
-            action_id=0,  # Will be assigned at build time
-            gimbal_pitch_rotate_enable=1,
-            gimbal_pitch_rotate_angle=0.0  # Forward position
-        )
-        self._actions.append(action)
+        self._actions.append(copy.copy(_GIMBAL_FRONT_TEMPLATE))
         return self
     
     def gimbal_pitch(self, angle: float) -> 'WaypointBuilder':
@@ -236,11 +269,7 @@ class WaypointBuilder:
         Args:
             angle: Pitch angle in degrees (-90 to +90, negative = down, positive = up)
         """
-        action = GimbalRotateAction(
-            action_id=0,  # Will be assigned at build time
-            gimbal_pitch_rotate_enable=1,
-            gimbal_pitch_rotate_angle=angle
-        )
+        action = _gimbal_pitch_action(angle)
         self._actions.append(action)
         return self
     
@@ -350,19 +379,22 @@ class DroneTask:
         self._current_waypoint: Optional[Waypoint] = None
         
         # Technical configuration with defaults
-        self._coordinate_system = CoordinateSystemParam(
+        self._coordinate_system = _construct(
+            CoordinateSystemParam,
             coordinate_system=CoordinateModeEnum.WGS84,
             height_mode=HeightModeEnum.RELATIVE,
             position_type=PositionTypeEnum.GPS
         )
         
-        self._mission_config = MissionConfig(
+        self._mission_config = _construct(
+            MissionConfig,
             fly_to_wayline_mode=FlyToWaylineMode.SAFELY,
             finish_action=FinishAction.GO_HOME,
             rclost_action=RCLostAction.CONTINUE,
             take_off_height=self.drone_config["takeoff_security_height"],
-            drone_info=DroneInfo(drone_model=self.drone_config["model"]),
-            payload_info=PayloadInfo(
+            drone_info=_construct(DroneInfo, drone_model=self.drone_config["model"]),
+            payload_info=_construct(
+                PayloadInfo,
                 payload_model=self.drone_config["default_payload"],
                 position=0  # Default position
             )
@@ -497,7 +529,8 @@ class DroneTask:
                 builder = getattr(waypoint, '_waypoint_builder')
                 global_action_id = builder._finalize_actions(global_action_id)
         
-        # Build KML with correct field names
+        # Build KML with correct field names. Pilot, speed and height come from the
+        # caller, so the top-level KML is always validated (this also copies waypoints).
         kml = KML(
             author=self.pilot,
             create_time=int(datetime.now().timestamp() * 1000),
@@ -0,0 +1,41 @@
+"""
+Benchmarks for the action XML hot path.
+
+These are skipped by the default test run (see norecursedirs in
+pyproject.toml). Run them explicitly with:
+
+    pytest tests/benchmark --benchmark-only
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from djikmz.model.action import TakePhotoAction, HoverAction
+from djikmz.model.action_group import ActionGroup
+
+
+def _wrap_xml(action):
+    return ''.join(('<wpml:action>', action.to_xml(), '</wpml:action>'))
+
+
+def test_take_photo_to_xml(benchmark):
+    action = TakePhotoAction(action_id=1, file_suffix="x")
+    benchmark(action.to_xml)
+
+
+def test_take_photo_from_xml(benchmark):
+    xml = _wrap_xml(TakePhotoAction(action_id=1, file_suffix="x"))
+    benchmark(TakePhotoAction.from_xml, xml)
+
+
+def test_hover_from_xml(benchmark):
+    xml = _wrap_xml(HoverAction(action_id=2, hover_time=5.0))
+    benchmark(HoverAction.from_xml, xml)
+
+
+def test_action_group_from_xml(benchmark):
+    group = ActionGroup(group_id=1)
+    group.add_actions([TakePhotoAction(file_suffix=f"p{i}") for i in range(20)])
+    xml = group.to_xml()
+    benchmark(ActionGroup.from_xml, xml)
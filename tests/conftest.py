@@ -0,0 +1,149 @@
+"""
+Shared pytest fixtures for the djikmz test suite.
+"""
+
+from functools import lru_cache
+
+import pytest
+
+
+@lru_cache(maxsize=64)
+def _parse_group_cached(xml_str: str):
+    """Parse an ActionGroup XML string, reusing the result for repeated strings."""
+    from djikmz.model.action_group import ActionGroup
+
+    return ActionGroup.from_xml(xml_str)
+
+
+@pytest.fixture
+def make_group():
+    """
+    Factory for ActionGroup objects built from trusted literals.
+
+    Uses model_construct so tests that are not about validation skip the
+    pydantic validator pipeline. Tests that exercise validators should keep
+    calling ActionGroup(...) / ActionTrigger(...) directly.
+    """
+    from djikmz.model.action_group import ActionGroup, ActionTrigger, TriggerType
+
+    def _make_group(trigger=None, trigger_kw=None, actions=None, **kw):
+        if trigger is None:
+            trigger = ActionTrigger.model_construct(
+                **(trigger_kw or {"type": TriggerType.REACH_POINT})
+            )
+        return ActionGroup.model_construct(
+            trigger=trigger,
+            actions=actions if actions is not None else [],
+            **kw
+        )
+
+    return _make_group
+
+
+@pytest.fixture(scope="module")
+def sample_actions():
+    """Photo, hover and yaw actions shared read-only by the tests of a module."""
+    from djikmz.model.action import TakePhotoAction, HoverAction, RotateYawAction
+
+    return [
+        TakePhotoAction.model_construct(action_id=1, file_suffix="photo1"),
+        HoverAction.model_construct(action_id=2, hover_time=3.0),
+        RotateYawAction.model_construct(action_id=3, aircraft_heading=180.0),
+    ]
+
+
+@pytest.fixture(scope="module")
+def timing_trigger():
+    """Multiple-timing trigger shared read-only by the tests of a module."""
+    from djikmz.model.action_group import ActionTrigger, TriggerType
+
+    return ActionTrigger.model_construct(type=TriggerType.MULTIPLE_TIMING, param=2.5)
+
+
+@pytest.fixture(scope="session")
+def roundtrip_cache():
+    """Session-wide store of ActionGroup XML roundtrips keyed by group contents."""
+    return {}
+
+
+@pytest.fixture
+def parse_group():
+    """
+    Memoized ActionGroup.from_xml.
+
+    Groups returned for the same XML string are shared, so callers must
+    treat them as read-only.
+    """
+    return _parse_group_cached
+
+
+@pytest.fixture
+def xml_roundtrip(roundtrip_cache, parse_group):
+    """
+    Serialize an ActionGroup to XML and parse it back, once per distinct group.
+
+    Returns a (xml_str, recreated_group) tuple. Callers must treat both as
+    read-only since they are shared across the session.
+    """
+    def _roundtrip(group):
+        key = (
+            group.group_id,
+            group.start_waypoint_id,
+            group.end_waypoint_id,
+            group.execution_mode,
+            group.trigger.type,
+            group.trigger.param,
+            tuple((type(a).__name__, tuple(a.__dict__.items())) for a in group.actions),
+        )
+        if key not in roundtrip_cache:
+            xml_str = group.to_xml()
+            roundtrip_cache[key] = (xml_str, parse_group(xml_str))
+        return roundtrip_cache[key]
+
+    return _roundtrip
+
+
+@pytest.fixture(scope="session")
+def from_dict_available():
+    """
+    Probe once per session whether ActionGroup.from_xml can rebuild actions.
+
+    Skips the requesting test when Action.from_dict is not implemented.
+    """
+    from djikmz.model.action_group import ActionGroup
+
+    try:
+        ActionGroup.from_xml(
+            "<wpml:actionGroup>"
+            "<wpml:actionGroupId>0</wpml:actionGroupId>"
+            "<wpml:action>"
+            "<wpml:actionId>1</wpml:actionId>"
+            "<wpml:actionActuatorFunc>takePhoto</wpml:actionActuatorFunc>"
+            "</wpml:action>"
+            "</wpml:actionGroup>"
+        )
+    except (AttributeError, NotImplementedError):
+        pytest.skip("Action.from_dict method not implemented")
+    return True
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_models():
+    """
+    Validate and serialize one instance of every registered action, of
+    CoordinateSystemParam and WaypointHeadingParam, and a default KML
+    before the first test runs.
+
+    Keeps module imports and pydantic-core's first-call costs out of the
+    individual tests.
+    """
+    from djikmz.model.action import ACTION_REGISTRY
+    from djikmz.model.coordinate_system_param import CoordinateSystemParam
+    from djikmz.model.heading_param import WaypointHeadingParam
+    from djikmz.model.kml import KML
+
+    for action_cls in ACTION_REGISTRY.values():
+        action_cls(action_id=0).to_xml()
+    CoordinateSystemParam().to_xml()
+    WaypointHeadingParam.from_xml(WaypointHeadingParam().to_xml())
+    KML().to_xml()
@@ -9,18 +9,47 @@ This test file covers the ActionGroup functionality including:
 - Field validation and business logic
 """
 
+import re
 import pytest
 from pydantic import ValidationError
-import xmltodict
-import sys
-import os
-
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from djikmz.model.action_group import ActionGroup, ActionTrigger, TriggerType
 from djikmz.model.action import TakePhotoAction, HoverAction, RotateYawAction
 
+_START_WP_RE = re.compile(re.escape("start_waypoint_id must be greater than or equal to group_id"))
+_END_WP_RE = re.compile(re.escape("end_waypoint_id must be greater than or equal to start_waypoint_id"))
+
+
+def _stub_action(cls, **kw):
+    """Build an unvalidated action for tests that only check count or type."""
+    kw.setdefault("action_id", 0)
+    return cls.model_construct(**kw)
+
+
+def _assert_group_equal(original, recreated):
+    """Assert that two ActionGroups carry the same header, trigger and actions."""
+    assert recreated.group_id == original.group_id
+    assert recreated.start_waypoint_id == original.start_waypoint_id
+    assert recreated.end_waypoint_id == original.end_waypoint_id
+    assert recreated.execution_mode == original.execution_mode
+    
+    assert recreated.trigger.type == original.trigger.type
+    assert recreated.trigger.param == original.trigger.param
+    
+    assert len(recreated.actions) == len(original.actions)
+    for original_action, recreated_action in zip(original.actions, recreated.actions):
+        assert type(recreated_action) == type(original_action)
+        assert recreated_action.action_id == original_action.action_id
+        assert recreated_action.action_type == original_action.action_type
+        
+        # Action-specific checks
+        if isinstance(original_action, TakePhotoAction):
+            assert recreated_action.file_suffix == original_action.file_suffix
+        elif isinstance(original_action, HoverAction):
+            assert recreated_action.hover_time == original_action.hover_time
+        elif isinstance(original_action, RotateYawAction):
+            assert recreated_action.aircraft_heading == original_action.aircraft_heading
+
 
 class TestTriggerType:
     """Test TriggerType enum."""
@@ -42,10 +71,10 @@ class TestActionTrigger:
     """Test ActionTrigger class."""
     
     def test_creation_with_defaults(self):
-        """Test creating ActionTrigger with default values."""
-        trigger = ActionTrigger()
-        assert trigger.type == TriggerType.REACH_POINT
-        assert trigger.param is None
+        """Test ActionTrigger default values."""
+        # Class-level defaults, no instance needed
+        assert ActionTrigger.model_fields['type'].default == TriggerType.REACH_POINT
+        assert ActionTrigger.model_fields['param'].default is None
     
     def test_creation_with_custom_values(self):
         """Test creating ActionTrigger with custom values."""
@@ -179,11 +208,11 @@ class TestActionGroup:
     def test_waypoint_validation_rules(self):
         """Test waypoint ID validation rules."""
         # start_waypoint_id must be >= group_id
-        with pytest.raises(ValidationError, match="start_waypoint_id must be greater than or equal to group_id"):
+        with pytest.raises(ValidationError, match=_START_WP_RE):
             ActionGroup(group_id=10, start_waypoint_id=5)
         
         # end_waypoint_id must be >= start_waypoint_id
-        with pytest.raises(ValidationError, match="end_waypoint_id must be greater than or equal to start_waypoint_id"):
+        with pytest.raises(ValidationError, match=_END_WP_RE):
             ActionGroup(group_id=5, start_waypoint_id=10, end_waypoint_id=8)
     
     def test_valid_waypoint_combinations(self):
@@ -216,9 +245,8 @@ class TestActionGroup:
         
         # Add actions
         actions = [
-            TakePhotoAction(action_id=1),
-            HoverAction(action_id=2, hover_time=5.0),
-            RotateYawAction(action_id=3, aircraft_heading=90.0)
+            _stub_action(cls, action_id=i)
+            for i, cls in enumerate((TakePhotoAction, HoverAction, RotateYawAction), 1)
         ]
         group = ActionGroup(actions=actions)
         assert len(group.actions) == 3
@@ -226,18 +254,15 @@ class TestActionGroup:
         assert isinstance(group.actions[1], HoverAction)
         assert isinstance(group.actions[2], RotateYawAction)
     
-    def test_to_dict(self):
+    def test_to_dict(self, make_group, sample_actions, timing_trigger):
         """Test converting ActionGroup to dictionary."""
-        trigger = ActionTrigger(type=TriggerType.MULTIPLE_TIMING, param=2.0)
-        actions = [TakePhotoAction(action_id=1, file_suffix="test")]
-        
-        group = ActionGroup(
+        group = make_group(
             group_id=5,
             start_waypoint_id=10,
             end_waypoint_id=15,
             execution_mode="sequence",
-            actions=actions,
-            trigger=trigger
+            actions=sample_actions,
+            trigger=timing_trigger
         )
         
         result = group.to_dict()
@@ -250,17 +275,18 @@ class TestActionGroup:
         
         # Check actions
         assert "wpml:action" in result
-        assert len(result["wpml:action"]) == 1
+        assert len(result["wpml:action"]) == 3
         assert result["wpml:action"][0]["wpml:actionActuatorFunc"] == "takePhoto"
+        assert result["wpml:action"][1]["wpml:actionActuatorFunc"] == "hover"
         
         # Check trigger
         assert "wpml:actionTrigger" in result
         assert result["wpml:actionTrigger"]["wpml:actionTriggerType"] == "multipleTiming"
     
-    def test_xml_serialization(self):
+    def test_xml_serialization(self, make_group):
         """Test XML serialization."""
         actions = [TakePhotoAction(action_id=1, file_suffix="photo")]
-        group = ActionGroup(
+        group = make_group(
             group_id=1,
             start_waypoint_id=2,
             end_waypoint_id=3,
@@ -274,12 +300,9 @@ class TestActionGroup:
         assert "wpml:actionGroupId" in xml_str
         assert "wpml:action" in xml_str
         assert "takePhoto" in xml_str
-        
-        # Parse XML to verify structure
-        parsed = xmltodict.parse(xml_str)
-        assert "wpml:actionGroup" in parsed
+        assert xml_str.count("<wpml:action>") == 1
     
-    def test_from_xml(self):
+    def test_from_xml(self, from_dict_available):
         """Test creating ActionGroup from XML."""
         # Note: This test would need to be adjusted based on the actual
         # implementation of Action.from_dict method
@@ -300,189 +323,51 @@ class TestActionGroup:
             </wpml:actionTrigger>
         </wpml:actionGroup>'''
         
-        # This test might need adjustment based on Action.from_dict implementation
-        try:
-            group = ActionGroup.from_xml(xml_data)
-            assert group.group_id == 5
-            assert group.start_waypoint_id == 10
-            assert group.end_waypoint_id == 15
-            assert group.execution_mode == "sequence"
-        except (AttributeError, NotImplementedError):
-            # Skip if Action.from_dict is not implemented
-            pytest.skip("Action.from_dict method not implemented")
-    
-    def test_xml_roundtrip(self):
+        group = ActionGroup.from_xml(xml_data)
+        assert group.group_id == 5
+        assert group.start_waypoint_id == 10
+        assert group.end_waypoint_id == 15
+        assert group.execution_mode == "sequence"
+        assert len(group.actions) == 1
+        assert isinstance(group.actions[0], TakePhotoAction)
+        assert group.actions[0].file_suffix == "test"
+    
+    @pytest.mark.parametrize("kwargs,with_actions,with_trigger", [
+        pytest.param({}, False, False, id="minimal"),
+        pytest.param({"group_id": 5, "start_waypoint_id": 10, "end_waypoint_id": 15,
+                      "execution_mode": "sequence"}, False, True, id="simple"),
+        pytest.param({"group_id": 1, "start_waypoint_id": 2, "end_waypoint_id": 3},
+                     False, True, id="empty_actions"),
+        pytest.param({"group_id": 5, "start_waypoint_id": 10, "end_waypoint_id": 15,
+                      "execution_mode": "sequence"}, True, True, id="full"),
+        pytest.param({"group_id": 7, "start_waypoint_id": 12, "end_waypoint_id": 18,
+                      "execution_mode": "sequence"}, True, True, id="with_actions"),
+        pytest.param({"group_id": 3, "start_waypoint_id": 4, "end_waypoint_id": 6},
+                     True, False, id="default_trigger"),
+    ])
+    def test_xml_roundtrip(self, kwargs, with_actions, with_trigger, make_group,
+                           sample_actions, timing_trigger, xml_roundtrip,
+                           from_dict_available):
         """Test XML serialization roundtrip - serialize to XML, parse back, compare."""
-        # Create ActionGroup with various configurations
-        trigger = ActionTrigger(type=TriggerType.MULTIPLE_TIMING, param=2.5)
-        actions = [
-            TakePhotoAction(action_id=1, file_suffix="photo1"),
-            HoverAction(action_id=2, hover_time=3.0),
-            RotateYawAction(action_id=3, aircraft_heading=180.0)
-        ]
-        
-        original_group = ActionGroup(
-            group_id=5,
-            start_waypoint_id=10,
-            end_waypoint_id=15,
-            execution_mode="sequence",
-            actions=actions,
-            trigger=trigger
-        )
-        
-        # Serialize to XML
-        xml_str = original_group.to_xml()
-        
-        # Deserialize from XML
-        recreated_group = ActionGroup.from_xml(xml_str)
-        
-        # Compare all fields
-        assert recreated_group.group_id == original_group.group_id
-        assert recreated_group.start_waypoint_id == original_group.start_waypoint_id
-        assert recreated_group.end_waypoint_id == original_group.end_waypoint_id
-        assert recreated_group.execution_mode == original_group.execution_mode
-        
-        # Compare trigger
-        assert recreated_group.trigger.type == original_group.trigger.type
-        assert recreated_group.trigger.param == original_group.trigger.param
-        
-        # Compare actions count and types
-        assert len(recreated_group.actions) == len(original_group.actions)
-        for orig_action, recreated_action in zip(original_group.actions, recreated_group.actions):
-            assert type(recreated_action) == type(orig_action)
-            assert recreated_action.action_id == orig_action.action_id
-            assert recreated_action.action_type == orig_action.action_type
-    
-    def test_xml_roundtrip_simple(self):
-        """Test XML roundtrip serialization and deserialization with simple group."""
-        # Create a simple ActionGroup
-        original_group = ActionGroup(
-            group_id=5,
-            start_waypoint_id=10,
-            end_waypoint_id=15,
-            execution_mode="sequence"
-        )
-        
-        # Serialize to XML
-        xml_str = original_group.to_xml()
-        
-        # Deserialize from XML
-        recreated_group = ActionGroup.from_xml(xml_str)
-        
-        # Verify all fields match
-        assert recreated_group.group_id == original_group.group_id
-        assert recreated_group.start_waypoint_id == original_group.start_waypoint_id
-        assert recreated_group.end_waypoint_id == original_group.end_waypoint_id
-        assert recreated_group.execution_mode == original_group.execution_mode
-        assert len(recreated_group.actions) == len(original_group.actions)
-        assert recreated_group.trigger.type == original_group.trigger.type
-        assert recreated_group.trigger.param == original_group.trigger.param
-    
-    def test_xml_roundtrip_with_actions(self):
-        """Test XML roundtrip with ActionGroup containing multiple actions."""
-        # Create ActionGroup with multiple actions
-        actions = [
-            TakePhotoAction(action_id=1, file_suffix="photo1"),
-            HoverAction(action_id=2, hover_time=5.0),
-            RotateYawAction(action_id=3, aircraft_heading=90.0)
-        ]
-        
-        trigger = ActionTrigger(type=TriggerType.MULTIPLE_TIMING, param=2.5)
-        
-        original_group = ActionGroup(
-            group_id=7,
-            start_waypoint_id=12,
-            end_waypoint_id=18,
-            execution_mode="sequence",
-            actions=actions,
-            trigger=trigger
-        )
-        
-        try:
-            # Serialize to XML
-            xml_str = original_group.to_xml()
-            
-            # Deserialize from XML
-            recreated_group = ActionGroup.from_xml(xml_str)
-            
-            # Verify group properties
-            assert recreated_group.group_id == original_group.group_id
-            assert recreated_group.start_waypoint_id == original_group.start_waypoint_id
-            assert recreated_group.end_waypoint_id == original_group.end_waypoint_id
-            assert recreated_group.execution_mode == original_group.execution_mode
-            
-            # Verify trigger
-            assert recreated_group.trigger.type == original_group.trigger.type
-            assert recreated_group.trigger.param == original_group.trigger.param
-            
-            # Verify actions count
-            assert len(recreated_group.actions) == len(original_group.actions)
-            
-            # Verify each action (if Action.from_dict is implemented)
-            for original_action, recreated_action in zip(original_group.actions, recreated_group.actions):
-                assert recreated_action.action_id == original_action.action_id
-                assert type(recreated_action) == type(original_action)
-                
-                # Action-specific checks
-                if isinstance(original_action, TakePhotoAction):
-                    assert recreated_action.file_suffix == original_action.file_suffix
-                elif isinstance(original_action, HoverAction):
-                    assert recreated_action.hover_time == original_action.hover_time
-                elif isinstance(original_action, RotateYawAction):
-                    assert recreated_action.aircraft_heading == original_action.aircraft_heading
-                    
-        except (AttributeError, NotImplementedError):
-            # Skip if Action.from_dict is not fully implemented
-            pytest.skip("Action.from_dict method not fully implemented for roundtrip testing")
-    
-    def test_xml_roundtrip_minimal(self):
-        """Test XML roundtrip with minimal ActionGroup (all defaults)."""
-        # Create minimal ActionGroup with defaults
-        original_group = ActionGroup()
-        
-        # Serialize to XML
-        xml_str = original_group.to_xml()
-        
-        # Deserialize from XML
-        recreated_group = ActionGroup.from_xml(xml_str)
-        
-        # Verify all fields match defaults
-        assert recreated_group.group_id == 0
-        assert recreated_group.start_waypoint_id == 0
-        assert recreated_group.end_waypoint_id == 0
-        assert recreated_group.execution_mode == "sequence"
-        assert len(recreated_group.actions) == 0
-        assert recreated_group.trigger.type == TriggerType.REACH_POINT
-        assert recreated_group.trigger.param is None or recreated_group.trigger.param == 0.0
-
-    def test_xml_roundtrip_empty_actions(self):
-        """Test XML roundtrip with ActionGroup that has no actions."""
-        original_group = ActionGroup(
-            group_id=1,
-            start_waypoint_id=2,
-            end_waypoint_id=3,
-            actions=[]  # No actions
-        )
-        
-        # Serialize to XML
-        xml_str = original_group.to_xml()
-        
-        # Deserialize from XML
-        recreated_group = ActionGroup.from_xml(xml_str)
-        
-        # Compare all fields
-        assert recreated_group.group_id == original_group.group_id
-        assert recreated_group.start_waypoint_id == original_group.start_waypoint_id
-        assert recreated_group.end_waypoint_id == original_group.end_waypoint_id
-        assert recreated_group.execution_mode == original_group.execution_mode
-        assert recreated_group.trigger.type == original_group.trigger.type
-        assert len(recreated_group.actions) == len(original_group.actions)
+        if kwargs:
+            original_group = make_group(
+                actions=sample_actions if with_actions else [],
+                trigger=timing_trigger if with_trigger else None,
+                **kwargs
+            )
+        else:
+            # All defaults, filled in by the validators
+            original_group = ActionGroup()
+        
+        # Serialize to XML and deserialize it back
+        xml_str, recreated_group = xml_roundtrip(original_group)
+        _assert_group_equal(original_group, recreated_group)
 
 
 class TestActionGroupComplexScenarios:
     """Test complex ActionGroup scenarios."""
     
-    def test_multiple_actions_different_types(self):
+    def test_multiple_actions_different_types(self, make_group):
         """Test ActionGroup with multiple different action types."""
         actions = [
             TakePhotoAction(action_id=1, file_suffix="photo1"),
@@ -491,7 +376,7 @@ class TestActionGroupComplexScenarios:
             TakePhotoAction(action_id=4, file_suffix="photo2")
         ]
         
-        group = ActionGroup(
+        group = make_group(
             group_id=1,
             start_waypoint_id=5,
             end_waypoint_id=10,
@@ -504,24 +389,19 @@ class TestActionGroupComplexScenarios:
         assert group.actions[2].aircraft_heading == 90.0
         assert group.actions[3].file_suffix == "photo2"
     
-    def test_trigger_with_timing_parameter(self):
+    def test_trigger_with_timing_parameter(self, make_group):
         """Test ActionGroup with timing-based trigger."""
-        trigger = ActionTrigger(
-            type=TriggerType.MULTIPLE_TIMING,
-            param=3.5
-        )
-        
-        group = ActionGroup(
+        group = make_group(
             group_id=2,
-            trigger=trigger
+            trigger_kw={"type": TriggerType.MULTIPLE_TIMING, "param": 3.5}
         )
         
         assert group.trigger.type == TriggerType.MULTIPLE_TIMING
         assert group.trigger.param == 3.5
     
-    def test_large_waypoint_ids(self):
+    def test_large_waypoint_ids(self, make_group):
         """Test ActionGroup with large waypoint IDs."""
-        group = ActionGroup(
+        group = make_group(
             group_id=1000,
             start_waypoint_id=2000,
             end_waypoint_id=3000
@@ -36,6 +36,24 @@ class TestActionGroupManagement:
         assert len(group.actions) == 1
         assert group.actions[0].action_id == 5
     
+    def test_add_actions_bulk(self):
+        """Test adding several actions at once."""
+        group = ActionGroup(group_id=1)
+        group.add_action(TakePhotoAction(action_id=1))
+        
+        group.add_actions([
+            HoverAction(action_id=50, hover_time=2.0),
+            GimbalRotateAction(action_id=60),
+        ])
+        
+        assert [a.action_id for a in group.actions] == [1, 2, 3]
+        assert group.actions[1].hover_time == 2.0
+        assert isinstance(group.get_action_by_id(3), GimbalRotateAction)
+        
+        group.add_actions([TakePhotoAction(action_id=9)], auto_id=False)
+        assert group.actions[-1].action_id == 9
+        assert group.get_action_by_id(9) is group.actions[-1]
+    
     def test_insert_action_at_beginning(self):
         """Test inserting action at the beginning."""
         group = ActionGroup(group_id=1)
@@ -171,6 +189,17 @@ class TestActionGroupManagement:
         assert group.actions[1].action_id == 2
         assert group.actions[2].action_id == 3
     
+    def test_move_action_to_same_index(self):
+        """Test that moving an action onto itself leaves the group unchanged."""
+        group = ActionGroup(group_id=1)
+        group.add_action(TakePhotoAction(action_id=1))
+        group.add_action(HoverAction(action_id=2, hover_time=1.0))
+        before = list(group.actions)
+        
+        group.move_action(1, 1)
+        
+        assert all(a is b for a, b in zip(group.actions, before))
+    
     def test_move_action_invalid_indices(self):
         """Test moving action with invalid indices."""
         group = ActionGroup(group_id=1)
@@ -194,6 +223,12 @@ class TestActionGroupManagement:
         
         assert len(group.actions) == 0
         assert group.action_count == 0
+        assert group.get_action_by_id(1) is None
+        
+        # IDs start over after clearing
+        group.add_action(GimbalRotateAction(action_id=7))
+        assert group.next_action_id == 2
+        assert isinstance(group.get_action_by_id(1), GimbalRotateAction)
     
     def test_get_action_by_id(self):
         """Test getting action by ID."""
@@ -212,6 +247,122 @@ class TestActionGroupManagement:
         not_found = group.get_action_by_id(999)
         assert not_found is None
     
+    def test_get_action_by_id_after_unrenumbered_changes(self):
+        """Test that ID lookups follow removals and inserts without renumbering."""
+        group = ActionGroup(group_id=1)
+        group.add_action(TakePhotoAction(action_id=1))
+        group.add_action(HoverAction(action_id=2, hover_time=1.0))
+        group.add_action(GimbalRotateAction(action_id=3))
+        
+        group.remove_action(1, auto_renumber=False)
+        group.insert_action(0, TakePhotoAction(action_id=7), auto_renumber=False)
+        
+        assert group.get_action_by_id(1) is None
+        assert isinstance(group.get_action_by_id(7), TakePhotoAction)
+        assert isinstance(group.get_action_by_id(3), GimbalRotateAction)
+        assert group.remove_action(2, auto_renumber=False) is True
+        assert [a.action_id for a in group.actions] == [7, 3]
+    
+    def test_out_of_range_id_does_not_reindex(self, monkeypatch):
+        """Test that unknown IDs of a sequential group are rejected without rebuilding the index."""
+        group = ActionGroup(group_id=1)
+        group.add_action(TakePhotoAction(action_id=1))
+        group.add_action(HoverAction(action_id=2, hover_time=1.0))
+
+        calls = []
+        monkeypatch.setattr(ActionGroup, "_reindex", lambda self: calls.append(self))
+
+        assert group.get_action_by_id(999) is None
+        assert group.remove_action(999) is False
+        assert group.get_action_by_id(0) is None
+        assert calls == []
+
+    def test_get_action_by_id_after_direct_append(self):
+        """Test that ID lookups see actions appended to the list directly."""
+        group = ActionGroup(group_id=1)
+        group.add_action(TakePhotoAction(action_id=1))
+        group.add_action(HoverAction(action_id=2, hover_time=1.0))
+
+        group.actions.append(GimbalRotateAction(action_id=5))
+
+        assert isinstance(group.get_action_by_id(5), GimbalRotateAction)
+        assert group.remove_action(5, auto_renumber=False) is True
+        assert [a.action_id for a in group.actions] == [1, 2]
+
+    def test_get_action_by_id_after_list_reassignment(self):
+        """Test that ID lookups see a reassigned actions list."""
+        group = ActionGroup(group_id=1)
+        group.add_action(TakePhotoAction(action_id=1))
+
+        group.actions = [HoverAction(action_id=7, hover_time=1.0), TakePhotoAction(action_id=8)]
+
+        assert group.get_action_by_id(1) is None
+        assert isinstance(group.get_action_by_id(7), HoverAction)
+        assert isinstance(group.get_action_by_id(8), TakePhotoAction)
+        assert group.remove_action(7, auto_renumber=False) is True
+        assert [a.action_id for a in group.actions] == [8]
+
+    def test_remove_action_after_direct_changes(self):
+        """Test removing by ID from a list that was changed directly."""
+        group = ActionGroup(group_id=1)
+        group.add_action(TakePhotoAction(action_id=1))
+        group.add_action(HoverAction(action_id=2, hover_time=1.0))
+        group.add_action(GimbalRotateAction(action_id=3))
+
+        group.actions[0] = TakePhotoAction(action_id=8)
+        group.actions.append(TakePhotoAction(action_id=5))
+
+        assert group.remove_action(3) is True
+        assert [a.action_id for a in group.actions] == [1, 2, 3]
+        assert isinstance(group.actions[2], TakePhotoAction)
+        assert group.remove_action(3) is True
+        assert [type(a) for a in group.actions] == [TakePhotoAction, HoverAction]
+
+    def test_insert_renumbers_after_direct_changes(self):
+        """Test that renumbering does not trust IDs changed directly in the list."""
+        group = ActionGroup(group_id=1)
+        group.add_action(TakePhotoAction(action_id=1))
+        group.add_action(HoverAction(action_id=2, hover_time=1.0))
+
+        group.actions[0] = TakePhotoAction(action_id=9)
+        group.insert_action(2, GimbalRotateAction(action_id=4))
+
+        assert [a.action_id for a in group.actions] == [1, 2, 3]
+        assert isinstance(group.get_action_by_id(3), GimbalRotateAction)
+
+    def test_move_to_same_index_leaves_ids(self):
+        """Test that a no-op move does not renumber the group."""
+        group = ActionGroup(group_id=1)
+        group.add_action(TakePhotoAction(action_id=4), auto_id=False)
+        group.add_action(HoverAction(action_id=6, hover_time=1.0), auto_id=False)
+
+        group.move_action(1, 1)
+
+        assert [a.action_id for a in group.actions] == [4, 6]
+
+    def test_renumber_keeps_action_parameters(self):
+        """Test that auto IDs and renumbering keep the action parameters."""
+        group = ActionGroup(group_id=1)
+        group.add_action(HoverAction(action_id=5, hover_time=7.5))
+        group.insert_action(0, TakePhotoAction(action_id=9, file_suffix="first"))
+        
+        assert group.actions[0].file_suffix == "first"
+        assert group.actions[1].action_id == 2
+        assert group.actions[1].hover_time == 7.5
+    
+    def test_insert_renumbers_whole_group_when_not_sequential(self):
+        """Test that renumbering starts from 1 when existing IDs are not sequential."""
+        group = ActionGroup(group_id=1, actions=[
+            TakePhotoAction(action_id=40),
+            HoverAction(action_id=41, hover_time=1.0),
+        ])
+        
+        group.insert_action(1, GimbalRotateAction(action_id=999))
+        
+        assert [a.action_id for a in group.actions] == [1, 2, 3]
+        assert isinstance(group.get_action_by_id(2), GimbalRotateAction)
+        assert group.get_action_by_id(40) is None
+    
     def test_action_count_property(self):
         """Test action_count property."""
         group = ActionGroup(group_id=1)
@@ -8,12 +8,6 @@ basic tests for the other actions.
 
 import pytest
 from pydantic import ValidationError
-import xmltodict
-import sys
-import os
-
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from djikmz.model.action import (
     Action,
@@ -33,6 +27,101 @@ from djikmz.model.action import (
 )
 from djikmz.model.action.camera_actions import PAYLOAD_LENS
 
+_EXPECTED_REGISTERED = frozenset({
+    ActionType.TAKE_PHOTO,
+    ActionType.START_RECORD,
+    ActionType.STOP_RECORD,
+    ActionType.GIMBAL_ROTATE,
+    ActionType.GIMBAL_EVENLY_ROTATE,
+    ActionType.HOVER,
+    ActionType.ROTATE_YAW,
+    ActionType.FOCUS,
+    ActionType.ZOOM,
+    ActionType.ACCURATE_SHOOT,
+    ActionType.ORIENTED_SHOOT,
+})
+
+# Constructor kwargs shared by the to_dict table, the XML fixtures and the roundtrip cases
+_TAKE_PHOTO_KW = {"action_id": 1, "payload_position": 1, "file_suffix": "test",
+                  "payload_lens": PAYLOAD_LENS.ZOOM}
+_HOVER_KW = {"action_id": 2, "hover_time": 5.0}
+
+# Every lens as enum member and as its string value, plus None for the default
+_PAYLOAD_LENS_CASES = (
+    [(lens, lens) for lens in PAYLOAD_LENS]
+    + [(lens.value, lens) for lens in PAYLOAD_LENS]
+    + [(None, None)]
+)
+
+
+# Default-valued actions shared read-only by the tests of this module
+
+@pytest.fixture(scope="module")
+def default_take_photo():
+    return TakePhotoAction()
+
+
+@pytest.fixture(scope="module")
+def default_hover():
+    return HoverAction()
+
+
+@pytest.fixture(scope="module")
+def default_gimbal_rotate():
+    return GimbalRotateAction()
+
+
+@pytest.fixture(scope="module")
+def default_rotate_yaw():
+    return RotateYawAction()
+
+
+@pytest.fixture(scope="module")
+def default_focus():
+    return FocusAction()
+
+
+@pytest.fixture(scope="module")
+def default_zoom():
+    return ZoomAction()
+
+
+@pytest.fixture(scope="module")
+def default_gimbal_evenly_rotate():
+    return GimbalEvenlyRotateAction()
+
+
+_ACTION_OPEN = '<wpml:action>'
+_ACTION_CLOSE = '</wpml:action>'
+
+
+def _wrap_xml(action):
+    """Serialize an action and wrap it in the <wpml:action> root from_xml expects."""
+    return ''.join((_ACTION_OPEN, action.to_xml(), _ACTION_CLOSE))
+
+
+# Actions paired with their wrapped XML, serialized once per module
+
+@pytest.fixture(scope="module")
+def take_photo_xml():
+    action = TakePhotoAction(**_TAKE_PHOTO_KW)
+    return action, _wrap_xml(action)
+
+
+@pytest.fixture(scope="module")
+def hover_xml():
+    action = HoverAction(action_id=3, hover_time=7.5)
+    return action, _wrap_xml(action)
+
+
+# (class, bound from_xml, constructor kwargs) for the XML roundtrip test
+_ROUNDTRIP = [
+    (TakePhotoAction, TakePhotoAction.from_xml, dict(action_id=1, file_suffix="test1")),
+    (HoverAction, HoverAction.from_xml, _HOVER_KW),
+    (RotateYawAction, RotateYawAction.from_xml, dict(action_id=3, aircraft_heading=90.0)),
+    (GimbalRotateAction, GimbalRotateAction.from_xml, dict(action_id=4, gimbal_pitch_rotate_enable=1)),
+]
+
 
 class TestActionType:
     """Test ActionType enum."""
@@ -52,7 +141,8 @@ class TestActionType:
     def test_action_type_immutable(self):
         """Test that action_type field is immutable after initialization."""
         action = TakePhotoAction()
-        with pytest.raises((ValidationError, AttributeError)):
+        # Field(frozen=True) makes pydantic reject assignment with a frozen_field error
+        with pytest.raises(ValidationError, match="frozen"):
             action.action_type = ActionType.HOVER
 
 
@@ -61,21 +151,7 @@ class TestActionRegistry:
     
     def test_all_actions_registered(self):
         """Test that all action types are registered."""
-        expected_types = {
-            ActionType.TAKE_PHOTO,
-            ActionType.START_RECORD,
-            ActionType.STOP_RECORD,
-            ActionType.GIMBAL_ROTATE,
-            ActionType.GIMBAL_EVENLY_ROTATE,
-            ActionType.HOVER,
-            ActionType.ROTATE_YAW,
-            ActionType.FOCUS,
-            ActionType.ZOOM,
-            ActionType.ACCURATE_SHOOT,
-            ActionType.ORIENTED_SHOOT,
-        }
-        registered_types = set(ACTION_REGISTRY.keys())
-        assert expected_types.issubset(registered_types)
+        assert _EXPECTED_REGISTERED <= ACTION_REGISTRY.keys()
     
     def test_action_classes_correct(self):
         """Test that correct action classes are registered."""
@@ -88,9 +164,9 @@ class TestActionRegistry:
 class TestTakePhotoAction:
     """Comprehensive tests for TakePhotoAction."""
     
-    def test_creation_with_defaults(self):
+    def test_creation_with_defaults(self, default_take_photo):
         """Test creating TakePhotoAction with default values."""
-        action = TakePhotoAction()
+        action = default_take_photo
         assert action.action_id == 0
         assert action.action_type == ActionType.TAKE_PHOTO
         assert action.payload_position == 0
@@ -110,81 +186,44 @@ class TestTakePhotoAction:
         assert action.file_suffix == "test_photo"
         assert action.payload_lens == PAYLOAD_LENS.ZOOM
     
-    def test_payload_position_validation(self):
+    @pytest.mark.parametrize("position,valid", [
+        (0, True), (1, True), (2, True), (-1, False), (3, False),
+    ])
+    def test_payload_position_validation(self, position, valid):
         """Test payload position validation."""
-        # Valid values
-        TakePhotoAction(payload_position=0)
-        TakePhotoAction(payload_position=1)
-        TakePhotoAction(payload_position=2)
-        
-        # Invalid values
-        with pytest.raises(ValidationError):
-            TakePhotoAction(payload_position=-1)
-        with pytest.raises(ValidationError):
-            TakePhotoAction(payload_position=3)
-    
-    def test_payload_lens_validation(self):
+        if valid:
+            TakePhotoAction(payload_position=position)
+        else:
+            with pytest.raises(ValidationError):
+                TakePhotoAction(payload_position=position)
+    
+    @pytest.mark.parametrize("lens,expected", _PAYLOAD_LENS_CASES)
+    def test_payload_lens_validation(self, lens, expected):
         """Test payload lens validation."""
-        # Valid enum value
-        action = TakePhotoAction(payload_lens=PAYLOAD_LENS.WIDE)
-        assert action.payload_lens == PAYLOAD_LENS.WIDE
-        
-        # Valid string value
-        action = TakePhotoAction(payload_lens="zoom")
-        assert action.payload_lens == PAYLOAD_LENS.ZOOM
-        
-        # None value
-        action = TakePhotoAction(payload_lens=None)
-        assert action.payload_lens is None
+        action = TakePhotoAction(payload_lens=lens)
+        assert action.payload_lens == expected
     
-    def test_action_id_validation(self):
+    @pytest.mark.parametrize("action_id,valid", [
+        (0, True), (65535, True), (-1, False), (65536, False),
+    ])
+    def test_action_id_validation(self, action_id, valid):
         """Test action ID validation."""
-        # Valid values
-        TakePhotoAction(action_id=0)
-        TakePhotoAction(action_id=65535)
-        
-        # Invalid values
-        with pytest.raises(ValidationError):
-            TakePhotoAction(action_id=-1)
-        with pytest.raises(ValidationError):
-            TakePhotoAction(action_id=65536)
+        if valid:
+            TakePhotoAction(action_id=action_id)
+        else:
+            with pytest.raises(ValidationError):
+                TakePhotoAction(action_id=action_id)
     
-    def test_to_dict(self):
-        """Test converting to dictionary."""
-        action = TakePhotoAction(
-            action_id=1,
-            payload_position=1,
-            file_suffix="test",
-            payload_lens=PAYLOAD_LENS.ZOOM
-        )
-        result = action.to_dict()
-        
-        # Check header fields
-        assert result["wpml:actionId"] == 1
-        assert result["wpml:actionActuatorFunc"] == "takePhoto"
-        
-        # Check action parameters
-        params = result["wpml:actionActuatorFuncParam"]
-        assert params["wpml:payloadPositionIndex"] == 1
-        assert params["wpml:fileSuffix"] == "test"
-        assert params["wpml:payloadLensIndex"] == "zoom"
-    
-    def test_xml_serialization(self):
+    def test_xml_serialization(self, take_photo_xml):
         """Test XML serialization and deserialization."""
-        action = TakePhotoAction(
-            action_id=1,
-            payload_position=1,
-            file_suffix="test"
-        )
+        action, xml_with_root = take_photo_xml
         
-        # Serialize to XML
-        xml_str = action.to_xml()
-        assert "wpml:actionId" in xml_str
-        assert "takePhoto" in xml_str
-        assert "test" in xml_str
+        # Serialized XML
+        assert "wpml:actionId" in xml_with_root
+        assert "takePhoto" in xml_with_root
+        assert "test" in xml_with_root
         
         # Deserialize from XML
-        xml_with_root = f'<wpml:action>{xml_str}</wpml:action>'
         recreated_action = TakePhotoAction.from_xml(xml_with_root)
         assert recreated_action.action_id == action.action_id
         assert recreated_action.action_type == action.action_type
@@ -194,9 +233,9 @@ class TestTakePhotoAction:
 class TestHoverAction:
     """Comprehensive tests for HoverAction."""
     
-    def test_creation_with_defaults(self):
+    def test_creation_with_defaults(self, default_hover):
         """Test creating HoverAction with default values."""
-        action = HoverAction()
+        action = default_hover
         assert action.action_id == 0
         assert action.action_type == ActionType.HOVER
         assert action.hover_time == 1.0
@@ -207,34 +246,20 @@ class TestHoverAction:
         assert action.action_id == 5
         assert action.hover_time == 10.5
     
-    def test_hover_time_validation(self):
+    @pytest.mark.parametrize("hover_time,valid", [
+        (0.1, True), (1.0, True), (999.9, True), (0.0, False), (-1.0, False),
+    ])
+    def test_hover_time_validation(self, hover_time, valid):
         """Test hover time validation."""
-        # Valid values
-        HoverAction(hover_time=0.1)
-        HoverAction(hover_time=1.0)
-        HoverAction(hover_time=999.9)
-        
-        # Invalid values
-        with pytest.raises(ValidationError):
-            HoverAction(hover_time=0.0)
-        with pytest.raises(ValidationError):
-            HoverAction(hover_time=-1.0)
-    
-    def test_to_dict(self):
-        """Test converting to dictionary."""
-        action = HoverAction(action_id=2, hover_time=5.0)
-        result = action.to_dict()
-        
-        assert result["wpml:actionId"] == 2
-        assert result["wpml:actionActuatorFunc"] == "hover"
-        params = result["wpml:actionActuatorFuncParam"]
-        assert params["wpml:hoverTime"] == 5.0
+        if valid:
+            HoverAction(hover_time=hover_time)
+        else:
+            with pytest.raises(ValidationError):
+                HoverAction(hover_time=hover_time)
     
-    def test_xml_roundtrip(self):
+    def test_xml_roundtrip(self, hover_xml):
         """Test XML serialization roundtrip."""
-        action = HoverAction(action_id=3, hover_time=7.5)
-        xml_str = action.to_xml()
-        xml_with_root = f'<wpml:action>{xml_str}</wpml:action>'
+        action, xml_with_root = hover_xml
         recreated_action = HoverAction.from_xml(xml_with_root)
         
         assert recreated_action.action_id == action.action_id
@@ -244,9 +269,9 @@ class TestHoverAction:
 class TestGimbalRotateAction:
     """Comprehensive tests for GimbalRotateAction."""
     
-    def test_creation_with_defaults(self):
+    def test_creation_with_defaults(self, default_gimbal_rotate):
         """Test creating GimbalRotateAction with default values."""
-        action = GimbalRotateAction()
+        action = default_gimbal_rotate
         assert action.action_id == 0
         assert action.action_type == ActionType.GIMBAL_ROTATE
         assert action.payload_position == 0
@@ -275,63 +300,51 @@ class TestGimbalRotateAction:
         assert action.gimbal_yaw_rotate_enable == 1
         assert action.gimbal_yaw_rotate_angle == 90.0
     
-    def test_payload_position_validation(self):
+    @pytest.mark.parametrize("position,valid", [
+        (0, True), (2, True), (-1, False), (3, False),
+    ])
+    def test_payload_position_validation(self, position, valid):
         """Test payload position validation."""
-        # Valid values
-        GimbalRotateAction(payload_position=0)
-        GimbalRotateAction(payload_position=2)
-        
-        # Invalid values
-        with pytest.raises(ValidationError):
-            GimbalRotateAction(payload_position=-1)
-        with pytest.raises(ValidationError):
-            GimbalRotateAction(payload_position=3)
-    
-    def test_gimbal_rotate_mode_validation(self):
+        if valid:
+            GimbalRotateAction(payload_position=position)
+        else:
+            with pytest.raises(ValidationError):
+                GimbalRotateAction(payload_position=position)
+    
+    @pytest.mark.parametrize("mode,valid", [
+        ("absoluteAngle", True), ("invalidMode", False),
+    ])
+    def test_gimbal_rotate_mode_validation(self, mode, valid):
         """Test gimbal rotate mode validation."""
-        # Valid value
-        GimbalRotateAction(gimbal_rotate_mode="absoluteAngle")
-        
-        # Invalid value
-        with pytest.raises(ValidationError):
-            GimbalRotateAction(gimbal_rotate_mode="invalidMode")
-    
-    def test_enable_flags_validation(self):
+        if valid:
+            GimbalRotateAction(gimbal_rotate_mode=mode)
+        else:
+            with pytest.raises(ValidationError):
+                GimbalRotateAction(gimbal_rotate_mode=mode)
+    
+    @pytest.mark.parametrize("field,value,valid", [
+        ("gimbal_pitch_rotate_enable", 0, True),
+        ("gimbal_pitch_rotate_enable", 1, True),
+        ("gimbal_roll_rotate_enable", 0, True),
+        ("gimbal_yaw_rotate_enable", 1, True),
+        ("gimbal_pitch_rotate_enable", -1, False),
+        ("gimbal_roll_rotate_enable", 2, False),
+    ])
+    def test_enable_flags_validation(self, field, value, valid):
         """Test enable flags validation."""
-        # Valid values (0 and 1)
-        GimbalRotateAction(gimbal_pitch_rotate_enable=0)
-        GimbalRotateAction(gimbal_pitch_rotate_enable=1)
-        GimbalRotateAction(gimbal_roll_rotate_enable=0)
-        GimbalRotateAction(gimbal_yaw_rotate_enable=1)
-        
-        # Invalid values
-        with pytest.raises(ValidationError):
-            GimbalRotateAction(gimbal_pitch_rotate_enable=-1)
-        with pytest.raises(ValidationError):
-            GimbalRotateAction(gimbal_roll_rotate_enable=2)
-    
-    def test_to_dict(self):
-        """Test converting to dictionary."""
-        action = GimbalRotateAction(
-            action_id=4,
-            gimbal_pitch_rotate_enable=1,
-            gimbal_pitch_rotate_angle=-30.0
-        )
-        result = action.to_dict()
-        
-        assert result["wpml:actionId"] == 4
-        assert result["wpml:actionActuatorFunc"] == "gimbalRotate"
-        params = result["wpml:actionActuatorFuncParam"]
-        assert params["wpml:gimbalPitchRotateEnable"] == 1
-        assert params["wpml:gimbalPitchRotateAngle"] == -30.0
+        if valid:
+            GimbalRotateAction(**{field: value})
+        else:
+            with pytest.raises(ValidationError):
+                GimbalRotateAction(**{field: value})
 
 
 class TestRotateYawAction:
     """Comprehensive tests for RotateYawAction."""
     
-    def test_creation_with_defaults(self):
+    def test_creation_with_defaults(self, default_rotate_yaw):
         """Test creating RotateYawAction with default values."""
-        action = RotateYawAction()
+        action = default_rotate_yaw
         assert action.action_id == 0
         assert action.action_type == ActionType.ROTATE_YAW
         assert action.aircraft_heading == 0.0
@@ -348,43 +361,27 @@ class TestRotateYawAction:
         assert action.aircraft_heading == 90.0
         assert action.direction == "counterClockwise"
     
-    def test_aircraft_heading_validation(self):
+    @pytest.mark.parametrize("heading,valid", [
+        (-180.0, True), (0.0, True), (180.0, True), (-180.1, False), (180.1, False),
+    ])
+    def test_aircraft_heading_validation(self, heading, valid):
         """Test aircraft heading validation."""
-        # Valid values
-        RotateYawAction(aircraft_heading=-180.0)
-        RotateYawAction(aircraft_heading=0.0)
-        RotateYawAction(aircraft_heading=180.0)
-        
-        # Invalid values
-        with pytest.raises(ValidationError):
-            RotateYawAction(aircraft_heading=-180.1)
-        with pytest.raises(ValidationError):
-            RotateYawAction(aircraft_heading=180.1)
-    
-    def test_direction_validation(self):
+        if valid:
+            RotateYawAction(aircraft_heading=heading)
+        else:
+            with pytest.raises(ValidationError):
+                RotateYawAction(aircraft_heading=heading)
+    
+    @pytest.mark.parametrize("direction,valid", [
+        ("clockwise", True), ("counterClockwise", True), ("invalid_direction", False),
+    ])
+    def test_direction_validation(self, direction, valid):
         """Test direction validation."""
-        # Valid values
-        RotateYawAction(direction="clockwise")
-        RotateYawAction(direction="counterClockwise")
-        
-        # Invalid value
-        with pytest.raises(ValidationError):
-            RotateYawAction(direction="invalid_direction")
-    
-    def test_to_dict(self):
-        """Test converting to dictionary."""
-        action = RotateYawAction(
-            action_id=20,
-            aircraft_heading=45.0,
-            direction="counterClockwise"
-        )
-        result = action.to_dict()
-        
-        assert result["wpml:actionId"] == 20
-        assert result["wpml:actionActuatorFunc"] == "rotateYaw"
-        params = result["wpml:actionActuatorFuncParam"]
-        assert params["wpml:aircraftHeading"] == 45.0
-        assert params["wpml:aircraftPathMode"] == "counterClockwise"
+        if valid:
+            RotateYawAction(direction=direction)
+        else:
+            with pytest.raises(ValidationError):
+                RotateYawAction(direction=direction)
 
 
 class TestRecordActions:
@@ -395,26 +392,20 @@ class TestRecordActions:
         action = StartRecordAction(action_id=1)
         assert action.action_type == ActionType.START_RECORD
         assert action.action_id == 1
-        
-        result = action.to_dict()
-        assert result["wpml:actionActuatorFunc"] == "startRecord"
     
     def test_stop_record_action(self):
         """Test StopRecordAction creation and basic functionality."""
         action = StopRecordAction(action_id=2)
         assert action.action_type == ActionType.STOP_RECORD
         assert action.action_id == 2
-        
-        result = action.to_dict()
-        assert result["wpml:actionActuatorFunc"] == "stopRecord"
 
 
 class TestFocusAction:
     """Basic tests for FocusAction."""
     
-    def test_creation_with_defaults(self):
+    def test_creation_with_defaults(self, default_focus):
         """Test creating FocusAction with default values."""
-        action = FocusAction()
+        action = default_focus
         assert action.action_type == ActionType.FOCUS
         assert action.payload_position == 0
         assert action.is_point_focus == 0
@@ -434,25 +425,27 @@ class TestFocusAction:
         assert action.focus_x == 0.5
         assert action.focus_y == 0.3
     
-    def test_focus_coordinates_validation(self):
+    @pytest.mark.parametrize("coords,valid", [
+        ({"focus_x": 0.0, "focus_y": 0.0}, True),
+        ({"focus_x": 1.0, "focus_y": 1.0}, True),
+        ({"focus_x": -0.1}, False),
+        ({"focus_y": 1.1}, False),
+    ])
+    def test_focus_coordinates_validation(self, coords, valid):
         """Test focus coordinates validation."""
-        # Valid values
-        FocusAction(focus_x=0.0, focus_y=0.0)
-        FocusAction(focus_x=1.0, focus_y=1.0)
-        
-        # Invalid values
-        with pytest.raises(ValidationError):
-            FocusAction(focus_x=-0.1)
-        with pytest.raises(ValidationError):
-            FocusAction(focus_y=1.1)
+        if valid:
+            FocusAction(**coords)
+        else:
+            with pytest.raises(ValidationError):
+                FocusAction(**coords)
 
 
 class TestZoomAction:
     """Basic tests for ZoomAction."""
     
-    def test_creation_with_defaults(self):
+    def test_creation_with_defaults(self, default_zoom):
         """Test creating ZoomAction with default values."""
-        action = ZoomAction()
+        action = default_zoom
         assert action.action_type == ActionType.ZOOM
         assert action.payload_position == 0
         assert action.focal_length == 24.0
@@ -468,17 +461,16 @@ class TestZoomAction:
         assert action.payload_position == 2
         assert action.focal_length == 85.0
     
-    def test_focal_length_validation(self):
+    @pytest.mark.parametrize("focal_length,valid", [
+        (24.0, True), (200.0, True), (0.0, False), (-10.0, False),
+    ])
+    def test_focal_length_validation(self, focal_length, valid):
         """Test focal length validation."""
-        # Valid values
-        ZoomAction(focal_length=24.0)
-        ZoomAction(focal_length=200.0)
-        
-        # Invalid values
-        with pytest.raises(ValidationError):
-            ZoomAction(focal_length=0.0)
-        with pytest.raises(ValidationError):
-            ZoomAction(focal_length=-10.0)
+        if valid:
+            ZoomAction(focal_length=focal_length)
+        else:
+            with pytest.raises(ValidationError):
+                ZoomAction(focal_length=focal_length)
 
 
 class TestShootingActions:
@@ -489,9 +481,6 @@ class TestShootingActions:
         action = AccurateShootAction(action_id=1)
         assert action.action_type == ActionType.ACCURATE_SHOOT
         assert action.payload_position == 0
-        
-        result = action.to_dict()
-        assert result["wpml:actionActuatorFunc"] == "accurateShoot"
     
     def test_oriented_shoot_action(self):
         """Test OrientedShootAction creation and basic functionality."""
@@ -510,9 +499,9 @@ class TestShootingActions:
 class TestGimbalEvenlyRotateAction:
     """Basic tests for GimbalEvenlyRotateAction."""
     
-    def test_creation_with_defaults(self):
+    def test_creation_with_defaults(self, default_gimbal_evenly_rotate):
         """Test creating GimbalEvenlyRotateAction with default values."""
-        action = GimbalEvenlyRotateAction()
+        action = default_gimbal_evenly_rotate
         assert action.action_type == ActionType.GIMBAL_EVENLY_ROTATE
         assert action.payload_position == 0
         assert action.pitch_rotate_angle == 0.0
@@ -527,32 +516,61 @@ class TestGimbalEvenlyRotateAction:
         assert action.pitch_rotate_angle == -60.0
 
 
+class TestToDict:
+    """Table-driven to_dict tests for the action classes."""
+    
+    @pytest.mark.parametrize("cls,kwargs,func_name,expected_params", [
+        pytest.param(TakePhotoAction, _TAKE_PHOTO_KW, "takePhoto",
+                     {"wpml:payloadPositionIndex": 1, "wpml:fileSuffix": "test",
+                      "wpml:payloadLensIndex": "zoom"},
+                     id="takePhoto"),
+        pytest.param(HoverAction, _HOVER_KW, "hover", {"wpml:hoverTime": 5.0}, id="hover"),
+        pytest.param(GimbalRotateAction,
+                     {"action_id": 4, "gimbal_pitch_rotate_enable": 1,
+                      "gimbal_pitch_rotate_angle": -30.0},
+                     "gimbalRotate",
+                     {"wpml:gimbalPitchRotateEnable": 1, "wpml:gimbalPitchRotateAngle": -30.0},
+                     id="gimbalRotate"),
+        pytest.param(RotateYawAction,
+                     {"action_id": 20, "aircraft_heading": 45.0, "direction": "counterClockwise"},
+                     "rotateYaw",
+                     {"wpml:aircraftHeading": 45.0, "wpml:aircraftPathMode": "counterClockwise"},
+                     id="rotateYaw"),
+        pytest.param(StartRecordAction, {"action_id": 1}, "startRecord", {}, id="startRecord"),
+        pytest.param(StopRecordAction, {"action_id": 2}, "stopRecord", {}, id="stopRecord"),
+        pytest.param(AccurateShootAction, {"action_id": 1}, "accurateShoot", {}, id="accurateShoot"),
+    ])
+    def test_to_dict(self, cls, kwargs, func_name, expected_params):
+        """Test converting to dictionary."""
+        result = cls(**kwargs).to_dict()
+        
+        # Check header fields
+        assert result["wpml:actionId"] == kwargs["action_id"]
+        assert result["wpml:actionActuatorFunc"] == func_name
+        
+        # Check action parameters
+        assert expected_params.items() <= result["wpml:actionActuatorFuncParam"].items()
+
+
 class TestXMLSerialization:
     """Test XML serialization/deserialization for various actions."""
     
-    def test_xml_roundtrip_multiple_actions(self):
+    @pytest.mark.parametrize("cls,from_xml,kwargs", _ROUNDTRIP,
+                             ids=[cls.__name__ for cls, _, _ in _ROUNDTRIP])
+    def test_xml_roundtrip_multiple_actions(self, cls, from_xml, kwargs):
         """Test XML roundtrip for multiple action types."""
-        actions = [
-            TakePhotoAction(action_id=1, file_suffix="test1"),
-            HoverAction(action_id=2, hover_time=5.0),
-            RotateYawAction(action_id=3, aircraft_heading=90.0),
-            GimbalRotateAction(action_id=4, gimbal_pitch_rotate_enable=1)
-        ]
+        action = cls(**kwargs)
+        xml_with_root = _wrap_xml(action)
+        
+        # Verify structure; from_xml below does the real parse
+        assert xml_with_root.count(_ACTION_OPEN) == 1
+        assert f"<wpml:actionId>{action.action_id}</wpml:actionId>" in xml_with_root
+        assert "<wpml:actionActuatorFunc>" in xml_with_root
         
-        for action in actions:
-            xml_str = action.to_xml()
-            xml_with_root = f'<wpml:action>{xml_str}</wpml:action>'
-            
-            # Parse back to verify structure
-            parsed = xmltodict.parse(xml_with_root)
-            assert "wpml:action" in parsed
-            assert "wpml:actionId" in parsed["wpml:action"]
-            assert "wpml:actionActuatorFunc" in parsed["wpml:action"]
-            
-            # Recreate and verify basic properties
-            recreated = action.__class__.from_xml(xml_with_root)
-            assert recreated.action_id == action.action_id
-            assert recreated.action_type == action.action_type
+        # Recreate and verify basic properties
+        recreated = from_xml(xml_with_root)
+        assert recreated.action_id == action.action_id
+        assert recreated.action_type == action.action_type
 
 
 if __name__ == "__main__":
@@ -59,6 +59,20 @@ class TestWaypointPoiPoint:
         assert poi.longitude == -122.4194
         assert poi.altitude == 100.0
     
+    def test_from_string_shares_instances(self):
+        """Test that identical POI strings give the same frozen instance."""
+        first = WaypointPoiPoint.from_string("37.7749,-122.4194,100.0")
+        second = WaypointPoiPoint.from_string("37.7749,-122.4194,100.0")
+        assert first is second
+        assert WaypointPoiPoint.get(37.7749, -122.4194, 100.0) is first
+
+    def test_from_string_keeps_signed_zero(self):
+        """Test that -0.0 and 0.0 POI strings are not shared."""
+        negative = WaypointPoiPoint.from_string("-0.0,0.0,-0.0")
+        positive = WaypointPoiPoint.from_string("0.0,0.0,0.0")
+        assert negative.to_string() == "-0.0,0.0,-0.0"
+        assert positive.to_string() == "0.0,0.0,0.0"
+
     def test_from_string_invalid(self):
         """Test invalid string format."""
         with pytest.raises(ValueError):
@@ -66,43 +80,34 @@ class TestWaypointPoiPoint:
         
         with pytest.raises(ValueError):
             WaypointPoiPoint.from_string("37.7749,-122.4194,100.0,extra")  # Too many parts
+    
+    def test_immutable(self):
+        """Test that POI points cannot be modified after creation."""
+        poi = WaypointPoiPoint(latitude=37.7749, longitude=-122.4194)
+        with pytest.raises(ValidationError, match="frozen"):
+            poi.latitude = 0.0
 
 
 class TestWaypointHeadingParam:
     """Test WaypointHeadingParam class."""
     
-    def test_follow_wayline_mode(self):
-        """Test follow wayline mode."""
+    @pytest.mark.parametrize("mode,path", [
+        (WaypointHeadingMode.FOLLOW_WAYLINE, WaypointHeadingPathMode.FOLLOW_BAD_ARC),
+        (WaypointHeadingMode.MANUALLY, WaypointHeadingPathMode.CLOCKWISE),
+        (WaypointHeadingMode.FIXED, WaypointHeadingPathMode.COUNTER_CLOCKWISE),
+    ])
+    def test_basic_modes(self, mode, path):
+        """Test modes that need neither an angle nor a POI point."""
         param = WaypointHeadingParam(
-            waypoint_heading_mode=WaypointHeadingMode.FOLLOW_WAYLINE,
-            waypoint_heading_path_mode=WaypointHeadingPathMode.FOLLOW_BAD_ARC
+            waypoint_heading_mode=mode,
+            waypoint_heading_path_mode=path
         )
         
-        assert param.waypoint_heading_mode == WaypointHeadingMode.FOLLOW_WAYLINE
-        assert param.waypoint_heading_path_mode == WaypointHeadingPathMode.FOLLOW_BAD_ARC
+        assert param.waypoint_heading_mode == mode
+        assert param.waypoint_heading_path_mode == path
         assert param.waypoint_heading_angle is None
         assert param.waypoint_poi_point is None
     
-    def test_manual_mode(self):
-        """Test manual mode."""
-        param = WaypointHeadingParam(
-            waypoint_heading_mode=WaypointHeadingMode.MANUALLY,
-            waypoint_heading_path_mode=WaypointHeadingPathMode.CLOCKWISE
-        )
-        
-        assert param.waypoint_heading_mode == WaypointHeadingMode.MANUALLY
-        assert param.waypoint_heading_path_mode == WaypointHeadingPathMode.CLOCKWISE
-    
-    def test_fixed_mode(self):
-        """Test fixed mode."""
-        param = WaypointHeadingParam(
-            waypoint_heading_mode=WaypointHeadingMode.FIXED,
-            waypoint_heading_path_mode=WaypointHeadingPathMode.COUNTER_CLOCKWISE
-        )
-        
-        assert param.waypoint_heading_mode == WaypointHeadingMode.FIXED
-        assert param.waypoint_heading_path_mode == WaypointHeadingPathMode.COUNTER_CLOCKWISE
-    
     def test_smooth_transition_mode_with_angle(self):
         """Test smooth transition mode with required angle."""
         param = WaypointHeadingParam(
@@ -114,14 +119,6 @@ class TestWaypointHeadingParam:
         assert param.waypoint_heading_mode == WaypointHeadingMode.SMOOTH_TRANSITION
         assert param.waypoint_heading_angle == 45.0
     
-    def test_smooth_transition_mode_missing_angle(self):
-        """Test smooth transition mode fails without angle."""
-        with pytest.raises(ValidationError, match="waypointHeadingAngle is required"):
-            WaypointHeadingParam(
-                waypoint_heading_mode=WaypointHeadingMode.SMOOTH_TRANSITION,
-                waypoint_heading_path_mode=WaypointHeadingPathMode.FOLLOW_BAD_ARC
-            )
-    
     def test_toward_poi_mode_with_poi(self):
         """Test toward POI mode with required POI point."""
         poi = WaypointPoiPoint(latitude=37.7749, longitude=-122.4194)
@@ -134,11 +131,15 @@ class TestWaypointHeadingParam:
         assert param.waypoint_heading_mode == WaypointHeadingMode.TOWARD_POI
         assert param.waypoint_poi_point == poi
     
-    def test_toward_poi_mode_missing_poi(self):
-        """Test toward POI mode fails without POI point."""
-        with pytest.raises(ValidationError, match="waypointPoiPoint is required"):
+    @pytest.mark.parametrize("mode,message", [
+        (WaypointHeadingMode.SMOOTH_TRANSITION, "waypointHeadingAngle is required"),
+        (WaypointHeadingMode.TOWARD_POI, "waypointPoiPoint is required"),
+    ])
+    def test_mode_missing_required_field(self, mode, message):
+        """Test modes that fail without their required angle or POI point."""
+        with pytest.raises(ValidationError, match=message):
             WaypointHeadingParam(
-                waypoint_heading_mode=WaypointHeadingMode.TOWARD_POI,
+                waypoint_heading_mode=mode,
                 waypoint_heading_path_mode=WaypointHeadingPathMode.FOLLOW_BAD_ARC
             )
     
@@ -2,15 +2,12 @@
 Test cases for KML module.
 """
 
+import re
+
 import pytest
 from datetime import datetime
 from pydantic import ValidationError
 
-# Fix the import in kml.py first
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from djikmz.model.kml import KML, WaypointTurnMode, GimbalPitchMode
 from djikmz.model.mission_config import MissionConfig
 from djikmz.model.coordinate_system_param import CoordinateSystemParam
@@ -19,6 +16,27 @@ from djikmz.model.turn_param import WaypointTurnParam
 from djikmz.model.waypoint import Waypoint
 
 
+_ROOT_TAGS = ("wpml:author", "wpml:createTime", "wpml:updateTime")
+_FOLDER_TAGS = (
+    "wpml:waylineCoordinateSysParam",
+    "wpml:autoFlightSpeed",
+    "wpml:globalHeight",
+    "wpml:globalWaypointHeadingParam",
+    "wpml:globalWaypointTurnMode",
+    "wpml:globalUseStraightLine",
+    "wpml:globalGimbalPitchMode",
+)
+_TAG_RE = re.compile("|".join(re.escape(t) for t in ("Folder",) + _ROOT_TAGS + _FOLDER_TAGS))
+
+
+def _tag_offsets(xml: str) -> dict:
+    """Offset of the first occurrence of each tag of interest, in one pass."""
+    offsets = {}
+    for m in _TAG_RE.finditer(xml):
+        offsets.setdefault(m.group(), m.start())
+    return offsets
+
+
 class TestKML:
     """Test KML class."""
     
@@ -159,26 +177,19 @@ class TestKML:
         kml = KML()
         xml_output = kml.to_xml()
         
+        offsets = _tag_offsets(xml_output)
+        
         # Check that Folder element exists
-        assert "Folder" in xml_output
+        assert "Folder" in offsets
+        folder_start = offsets["Folder"]
         
         # Check that root level and folder level elements are properly separated
         # Root level elements should not be in folder
-        # assert xml_output.find("wpml:templateType") > xml_output.find("Folder")
-        assert xml_output.find("wpml:author") < xml_output.find("Folder")
-        assert xml_output.find("wpml:createTime") < xml_output.find("Folder")
-        assert xml_output.find("wpml:updateTime") < xml_output.find("Folder")
+        for tag in _ROOT_TAGS:
+            assert offsets[tag] < folder_start
         # Folder elements should be in folder
-        folder_start = xml_output.find("Folder")
-        # assert xml_output.find("wpml:author", folder_start) > folder_start
-        # assert xml_output.find("wpml:missionConfig", folder_start) > folder_start
-        assert xml_output.find("wpml:waylineCoordinateSysParam", folder_start) > folder_start
-        assert xml_output.find("wpml:autoFlightSpeed", folder_start) > folder_start
-        assert xml_output.find("wpml:globalHeight", folder_start) > folder_start
-        assert xml_output.find("wpml:globalWaypointHeadingParam", folder_start) > folder_start
-        assert xml_output.find("wpml:globalWaypointTurnMode", folder_start) > folder_start
-        assert xml_output.find("wpml:globalUseStraightLine", folder_start) > folder_start
-        assert xml_output.find("wpml:globalGimbalPitchMode", folder_start) > folder_start
+        for tag in _FOLDER_TAGS:
+            assert offsets[tag] > folder_start
     
     def test_to_xml_roundtrip_basic(self):
         """Test basic XML serialization roundtrip."""
@@ -301,6 +312,11 @@ class TestKMLValidation:
         with pytest.raises(ValidationError):
             KML(global_use_straight_line=-1)
 
+    def test_from_dict_unknown_key(self):
+        """Test that from_dict rejects keys that are not KML fields."""
+        with pytest.raises(KeyError, match="notAField"):
+            KML.from_dict({"wpml:author": "Test", "Folder": {"wpml:notAField": 1}})
+
 
 class TestKMLEnums:
     """Test KML enum classes."""
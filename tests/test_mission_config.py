@@ -13,7 +13,8 @@ from djikmz.model.mission_config import (
     PayloadModel,
     PayloadInfo,
     MissionConfig,
-    MODEL_TO_VAL
+    MODEL_TO_VAL,
+    VAL_TO_MODEL
 )
 
 
@@ -75,10 +76,16 @@ class TestDroneModel:
     
     def test_model_to_val_mapping(self):
         """Test MODEL_TO_VAL mapping."""
-        assert MODEL_TO_VAL[DroneModel.M350] == [89, None]
-        assert MODEL_TO_VAL[DroneModel.M300] == [60, None]
-        assert MODEL_TO_VAL[DroneModel.M30] == [67, 0]
-        assert MODEL_TO_VAL[DroneModel.M30T] == [67, 1]
+        assert MODEL_TO_VAL[DroneModel.M350] == (89, None)
+        assert MODEL_TO_VAL[DroneModel.M300] == (60, None)
+        assert MODEL_TO_VAL[DroneModel.M30] == (67, 0)
+        assert MODEL_TO_VAL[DroneModel.M30T] == (67, 1)
+    
+    def test_val_to_model_mapping(self):
+        """Test VAL_TO_MODEL is the inverse of MODEL_TO_VAL."""
+        assert len(VAL_TO_MODEL) == len(MODEL_TO_VAL)
+        for model, vals in MODEL_TO_VAL.items():
+            assert VAL_TO_MODEL[vals] == model
 
 
 class TestPayloadModel:
@@ -138,6 +145,25 @@ class TestDroneInfo:
         }
         assert result == expected
     
+    def test_to_dict_returns_copy(self):
+        """Test that changing a returned dict does not affect later calls."""
+        drone_info = DroneInfo(drone_model=DroneModel.M30T)
+        drone_info.to_dict()["wpml:droneEnumValue"] = 0
+        
+        assert drone_info.to_dict()["wpml:droneEnumValue"] == 67
+    
+    def test_to_dict_after_model_copy(self):
+        """Test that a copy with an updated model serializes the new values."""
+        drone_info = DroneInfo(drone_model=DroneModel.M30)
+        drone_info.to_dict()
+        
+        copied = drone_info.model_copy(update={"drone_model": DroneModel.M3E})
+        
+        assert copied.to_dict() == {
+            "wpml:droneEnumValue": 77,
+            "wpml:droneSubEnumValue": 0
+        }
+    
     def test_to_dict_no_sub_enum(self):
         """Test to_dict method for drone without sub enum."""
         drone_info = DroneInfo(drone_model=DroneModel.M350)
@@ -161,6 +187,19 @@ class TestDroneInfo:
         assert drone_info.drone_enum_value == 67
         assert drone_info.drone_sub_enum_value == 1
     
+    def test_from_dict_shares_instances(self):
+        """Test that identical dicts give the same frozen DroneInfo."""
+        data = {
+            "wpml:droneEnumValue": 67,
+            "wpml:droneSubEnumValue": 1
+        }
+        
+        drone_info = DroneInfo.from_dict(data)
+        
+        assert DroneInfo.from_dict(dict(data)) is drone_info
+        with pytest.raises(ValidationError, match="frozen"):
+            drone_info.drone_model = DroneModel.M30
+    
     def test_from_dict_no_sub_enum(self):
         """Test from_dict method without sub enum."""
         data = {
@@ -201,6 +240,12 @@ class TestDroneInfo:
         assert recreated.drone_model == original.drone_model
         assert recreated.drone_enum_value == original.drone_enum_value
         assert recreated.drone_sub_enum_value == original.drone_sub_enum_value
+    
+    def test_from_xml_shares_instances(self):
+        """Test that the same XML string gives the same frozen DroneInfo."""
+        xml_str = f'<wpml:droneInfo>{DroneInfo(drone_model=DroneModel.M3E).to_xml()}</wpml:droneInfo>'
+        
+        assert DroneInfo.from_xml(xml_str) is DroneInfo.from_xml(xml_str)
 
 
 class TestPayloadInfo:
@@ -250,6 +295,38 @@ class TestPayloadInfo:
         assert payload_info.payload_model == PayloadModel.H20T
         assert payload_info.position == 1
     
+    def test_from_dict_shares_instances(self):
+        """Test that identical dicts give the same frozen PayloadInfo."""
+        data = {
+            "wpml:payloadEnumValue": 43,
+            "wpml:payloadPositionIndex": 1
+        }
+        
+        payload_info = PayloadInfo.from_dict(data)
+        
+        assert PayloadInfo.from_dict(dict(data)) is payload_info
+        with pytest.raises(ValidationError, match="frozen"):
+            payload_info.position = 2
+
+    def test_from_dict_unhashable_position(self):
+        """Test that a nested position value fails validation instead of the cache."""
+        with pytest.raises(ValidationError):
+            PayloadInfo.from_dict({"wpml:payloadPositionIndex": {"x": 1}})
+        with pytest.raises(ValidationError):
+            PayloadInfo.from_xml(
+                "<wpml:payloadInfo><wpml:payloadEnumValue>43</wpml:payloadEnumValue>"
+                "<wpml:payloadPositionIndex><a>1</a></wpml:payloadPositionIndex></wpml:payloadInfo>"
+            )
+
+    def test_to_dict_after_model_copy(self):
+        """Test that a copy with an updated position serializes the new value."""
+        payload_info = PayloadInfo(payload_model=PayloadModel.H20T, position=0)
+        payload_info.to_dict()
+        
+        copied = payload_info.model_copy(update={"position": 2})
+        
+        assert copied.to_dict()["wpml:payloadPositionIndex"] == 2
+    
     def test_xml_roundtrip(self):
         """Test XML serialization roundtrip."""
         original = PayloadInfo(
@@ -6,15 +6,12 @@ Includes a test that generates a real KMZ file for DJI controller testing.
 """
 
 import pytest
-import sys
 import tempfile
 import os
+import math
 import zipfile
 from pathlib import Path
 
-# Add src to path for local imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from djikmz import DroneTask, ValidationError, HardwareError
 from pydantic import ValidationError as PydanticValidationError
 from djikmz.model import KML, Waypoint, PayloadModel
@@ -176,6 +173,38 @@ class TestTaskBuilderActions:
         assert action.gimbal_yaw_rotate_enable == 1
         assert action.gimbal_yaw_rotate_angle == 90.0
         
+    def test_gimbal_down_zero_keeps_sign(self):
+        """Test that gimbal_down(0.0) still writes a negative zero pitch."""
+        task = (DroneTask("M30T", "Test Pilot")
+               .fly_to(37.7749, -122.4194)
+               .gimbal_down(0.0)
+               .gimbal_front())
+
+        kml = task.build()
+        down, front = kml.waypoints[0].action_group.actions
+        assert math.copysign(1.0, down.gimbal_pitch_rotate_angle) == -1.0
+        assert math.copysign(1.0, front.gimbal_pitch_rotate_angle) == 1.0
+        assert "<wpml:gimbalPitchRotateAngle>-0.0</wpml:gimbalPitchRotateAngle>" in down.to_xml()
+
+    def test_gimbal_templates_are_not_shared(self):
+        """Test that fixed-angle gimbal actions are independent copies."""
+        task = (DroneTask("M30T", "Test Pilot")
+               .fly_to(37.7749, -122.4194)
+               .gimbal_front()
+               .gimbal_down(90)
+               .fly_to(37.7750, -122.4195)
+               .gimbal_front()
+               .gimbal_down(90))
+
+        kml = task.build()
+        first = kml.waypoints[0].action_group.actions
+        second = kml.waypoints[1].action_group.actions
+        assert [a.action_id for a in first] == [0, 1]
+        assert [a.action_id for a in second] == [2, 3]
+        assert first[0] is not second[0]
+        assert first[1].gimbal_pitch_rotate_angle == -90.0
+        assert second[1].gimbal_pitch_rotate_angle == -90.0
+
     def test_multiple_actions_per_waypoint(self):
         """Test multiple actions on a single waypoint."""
         task = (DroneTask("M30T", "Test Pilot")
@@ -220,6 +249,17 @@ class TestTaskBuilderValidation:
         kml = task.build()
         assert kml is not None
 
+    @pytest.mark.parametrize("pilot", [None, 123])
+    def test_invalid_pilot_rejected(self, pilot):
+        """Test that a pilot that is not a string fails KML validation."""
+        with pytest.raises(PydanticValidationError):
+            DroneTask("M30T", pilot).fly_to(37.7749, -122.4194).build()
+
+    def test_nan_altitude_rejected(self):
+        """Test that a NaN flight height fails KML validation."""
+        with pytest.raises(PydanticValidationError):
+            DroneTask("M30T", "Test Pilot").altitude(float("nan")).fly_to(37.7749, -122.4194).build()
+
 
 class TestTaskBuilderKMZGeneration:
     """Test KMZ file generation and XML output."""
@@ -236,6 +276,37 @@ class TestTaskBuilderKMZGeneration:
         assert kml.mission_config is not None
         assert len(kml.waypoints) == 1
         
+    def test_build_is_not_affected_by_later_waypoints(self):
+        """Test that adding waypoints after build() leaves the built KML unchanged."""
+        task = DroneTask("M30T", "Test Pilot")
+        task.fly_to(37.7749, -122.4194)
+        kml = task.build()
+
+        task.fly_to(37.7750, -122.4195)
+
+        assert len(kml.waypoints) == 1
+        assert kml.waypoints is not task._waypoints
+        assert len(task.build().waypoints) == 2
+
+    def test_trusted_construction_matches_validated(self, monkeypatch):
+        """Test that skipping validation for internal models yields the same mission."""
+        import djikmz.task_builder as task_builder
+
+        def build_dict():
+            kml = (DroneTask("M30T", "Test Pilot")
+                   .speed(8)
+                   .fly_to(37.7749, -122.4194)
+                   .turn_mode("early_turn")
+                   .take_photo("test")
+                   .build())
+            data = kml.to_dict()
+            del data["wpml:createTime"], data["wpml:updateTime"]
+            return data
+
+        trusted = build_dict()
+        monkeypatch.setattr(task_builder, "_TRUST_INTERNAL", False)
+        assert build_dict() == trusted
+
     def test_xml_output(self):
         """Test XML output generation."""
         task = (DroneTask("M30T", "Test Pilot")